@@ -1,3 +1,12 @@
 """A lightweight, decoupled wrapper for dynamic class assignment."""
-from .borg_pod import BorgPod, resist, assimilate
+from .borg_pod import (
+    BorgPod, CompactBorgPod, resist, borg_cached, assimilate, assimilate_many, spawn_many, wrap_depth,
+    enable_drone_cache, disable_drone_cache, transition_plan_stats, enable_class_index, disable_class_index, pods_of,
+    pod_count, enable_dirty_tracking, disable_dirty_tracking, dirty_attributes, dirty_pods, CLASS_CHANGE,
+    snapshot, snapshot_many, rollback, rollback_many,
+    enable_metrics, disable_metrics, metrics_snapshot,
+)
+from .pod_array import PodArray
+from .pod_containers import PodSet, PodDict
+from .shared_store import SharedPodStore
 name = "borg_pod"
@@ -0,0 +1,1142 @@
+"""
+The demonstration classes and assertion tests of borg_pod, pod_array and shared_store. They live here rather than in
+    those modules so that importing borg_pod doesn't build them. Run with: python -m borg_pod.borg_pod
+"""
+import copy
+import gc
+import math
+import pickle
+import sys
+import threading
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from .borg_pod import (
+    BorgPod, CompactBorgPod, resist, borg_cached, assimilate, assimilate_many, spawn_many, wrap_depth,
+    enable_drone_cache, disable_drone_cache, transition_plan_stats, enable_class_index, disable_class_index, pods_of,
+    pod_count, enable_dirty_tracking, disable_dirty_tracking, dirty_attributes, dirty_pods, CLASS_CHANGE,
+    snapshot, snapshot_many, rollback, rollback_many, enable_metrics, disable_metrics, metrics_snapshot,
+    DEFAULT_BORG_CACHE_SIZE, DRONE, OUT_OF_BAND_MIN_BYTES, _DIRTY_PODS, _POD_TRANSITION_PLANS, _QUEEN_BASES,
+    _QUEEN_REF, _POD_PENDING_PREPARATION, _SET_HOOKS, _SNAPSHOTS, _POD_FORWARDS, _clear_forwarding_cache,
+    _generated_queen_class, _add_set_hook, _remove_set_hook,
+)
+from .pod_array import PodArray
+from .pod_containers import PodSet, PodDict
+from .shared_store import SharedPodStore
+
+
+class _PerfectGreekInfluencedChalkDrawingOfFace(object):  # Abandon all hope of helpful docs/names, ye' who enter here.
+    """The first step towards drawing any circle."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shape_type = "pre-circle"
+
+    def self_method(self):
+        return self
+
+
+@assimilate(default_class=BorgPod)
+class _Circle(_PerfectGreekInfluencedChalkDrawingOfFace):
+    """
+    The Borg Pod does not care about unique inheritance. Your biological distinctiveness has been added to the
+        collective.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shape_type = "circle"
+
+    @staticmethod
+    def info():
+        print("I AM CIRCLE.")
+
+    # def self_method(self):  # Oh no! But inheritance still works.
+    #     return self
+
+    def __str__(self):
+        if hasattr(self, DRONE):
+            return "<{} object #{} bound to same address as Queen id #{}>".format(
+                self.drone.__class__.__name__, id(self.drone), id(self.queen)
+            )
+        return "<Unassimilated {} object #{}>".format(self.__class__.__name__, id(self))
+
+    __repr__ = __str__
+
+
+@assimilate
+class _Ellipse(_Circle):
+    """
+    The Borg Pod does not care about unique inheritance. Your biological distinctiveness has been added to the
+        collective.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shape_type = "ellipse"
+
+
+@assimilate
+class _AlphaNumeric(object):
+    """
+    The Borg Pod does not care about unique signatures. Your technological distinctiveness has been added to the
+        collective.
+    """
+    def __init__(self):
+        self.shape_type = "character"
+
+    @staticmethod
+    def info():
+        print("I AM CHARACTER.")
+
+    def self_method(self):
+        self.info()
+        return self
+
+    def __add__(self, other):
+        print("IN _ALPHANUMERIC __add__(): {} + {}".format(self, other))
+        return 1
+
+    def __str__(self):
+        if hasattr(self, DRONE):
+            return "<{} object #{} bound to same address as Queen id #{}>".format(
+                self.drone.__class__.__name__, id(self.drone), id(self.queen)
+            )
+        return "<Unassimilated {} object #{}>".format(self.__class__.__name__, id(self))
+
+    __repr__ = __str__
+
+
+@assimilate(generate_queen=True)
+class _Punctuation(object):
+    """The Borg Pod does care about resistance due to the current political climate, but stresses its futility."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shape_type = "punctuation"
+
+    @staticmethod
+    def info():
+        print("I AM PUNCTUATION.")
+
+    @resist
+    def self_method(self):
+        return self
+
+    def __str__(self):
+        if hasattr(self, DRONE):
+            return "<{} object #{} bound to same address as Queen id #{}>".format(
+                self.drone.__class__.__name__, id(self.drone), id(self.queen)
+            )
+        return "<Unassimilated {} object #{}>".format(self.__class__.__name__, id(self))
+
+    __repr__ = __str__
+
+
+@assimilate
+class _Glyph(object):
+    """The Borg Pod does not care how little room you take up. Your spatial distinctiveness has been compacted."""
+    __slots__ = ("shape_type", "strokes")
+
+    def __init__(self, strokes=1):
+        super().__init__()
+        self.shape_type = "glyph"
+        self.strokes = strokes
+
+    def self_method(self):
+        return self
+
+
+@assimilate
+class _Rune(_Glyph):
+    """A glyph with a little more to it."""
+    __slots__ = ("power",)
+
+    def __init__(self):
+        super().__init__(self.strokes)
+        self.shape_type = "rune"
+        self.power = self.strokes * 2
+
+
+def _compare_seq(sequence, sequence_2=None):
+    """
+    Print whether items in the iterable are/are not the same as the next element in the same list,
+        or the matching-index elements in sequence_2 (if not None).
+    """
+    if sequence_2 is None:
+        for ob_a, ob_b in zip(sequence, sequence[1::] + [sequence[0]]):
+            print("{}: {} is {}".format(ob_a is ob_b, ob_a, ob_b))
+    else:
+        for ob_a, ob_b in zip(sequence, sequence_2):
+            print("{}: {} is {}".format(ob_a is ob_b, ob_a, ob_b))
+
+
+def _assert_seq(sequence, sequence_2=None, *, assert_val=True):
+    """
+    Assert that items in the iterable are/are not the same as the next element in the same list,
+        or the matching-index element in sequence_2 (if not None).
+    """
+    if sequence_2 is None:
+        for ob_a, ob_b in zip(sequence, sequence[1::] + [sequence[0]]):
+            assert (ob_a is ob_b) == assert_val, "Assertion that {} is {} did not match provided value of {}.".format(
+                ob_a, ob_b, assert_val
+            )
+    else:
+        for ob_a, ob_b in zip(sequence, sequence_2):
+            assert (ob_a is ob_b) == assert_val, "Assertion that {} is {} did not match provided value of {}.".format(
+                ob_a, ob_b, assert_val
+            )
+
+
+def _convert_seq(sequence, new_class):
+    """Convert the iterable to a new class!"""
+    return list(assimilate_many(sequence, new_class))
+
+
+def _identity_crisis_test(num_objects):
+    """Test creation, identity, and inheritance control flows."""
+    test_objects_original = [BorgPod() for _ in range(num_objects)]
+    print("\n____\nBEGIN @ASSIMILATE IDENTITY TESTS\n")
+    print("Are they unique objects?")
+    _assert_seq(test_objects_original, assert_val=False)
+
+    print("\nConvert To Circles->")
+    test_objects_circle = _convert_seq(test_objects_original, _Circle)
+    print("Are they unique objects?")
+    _assert_seq(test_objects_circle, assert_val=False)
+    print("Is equal to original list?")
+    _assert_seq(test_objects_circle, test_objects_original)
+    print("what if we return self?")
+    self_list_ambiguous = [obj.self_method() for obj in test_objects_circle]
+    print("Are they equal to the old version?")
+    _assert_seq(self_list_ambiguous, test_objects_circle)
+    print("Can we still use instances of an undecorated parent class if a subclass is decorated with @assimilate?")
+    test_objects_undecorated_parent_class = [_PerfectGreekInfluencedChalkDrawingOfFace() for _ in range(num_objects)]
+    self_list_face = [obj.self_method() for obj in test_objects_undecorated_parent_class]
+    for face_return, original_face in zip(self_list_face, test_objects_undecorated_parent_class):
+        assert not isinstance(face_return, BorgPod)
+        assert isinstance(face_return, _PerfectGreekInfluencedChalkDrawingOfFace)
+        assert not isinstance(original_face, BorgPod)
+        assert isinstance(original_face, _PerfectGreekInfluencedChalkDrawingOfFace)
+        assert face_return is original_face
+    print("What if we use a child class decorated with @assimilate when a parent class is also decorated?")
+    print("Is the inherited method still only wrapped once, with the undecorated parent's method left alone?")
+    assert wrap_depth(_Ellipse.self_method) == wrap_depth(_Circle.self_method) == 1
+    assert wrap_depth(_PerfectGreekInfluencedChalkDrawingOfFace.self_method) == 0
+    test_objects_decorated_subclass = [_Ellipse() for _ in range(num_objects)]
+    print("Is the self-return converted properly?")
+    self_list_sub = [obj.self_method() for obj in test_objects_decorated_subclass]
+    _assert_seq(self_list_sub, test_objects_decorated_subclass)
+    print("Can the sub-class still be converted?")
+    print("\nConvert To Characters->")
+    test_objects_subclass_converted = _convert_seq(test_objects_decorated_subclass, _AlphaNumeric)
+    _assert_seq(test_objects_subclass_converted, test_objects_decorated_subclass)
+    print("Can they reuse their old drones if we convert them back?")
+    for obj in test_objects_subclass_converted:
+        enable_drone_cache(obj)
+    drone_list_characters = [obj.drone for obj in test_objects_subclass_converted]
+    _convert_seq(_convert_seq(test_objects_subclass_converted, _Ellipse), _AlphaNumeric)
+    _assert_seq([obj.drone for obj in test_objects_subclass_converted], drone_list_characters)
+    for obj in test_objects_subclass_converted:
+        disable_drone_cache(obj)
+    print("Are they converted one at a time if we stream a generator of them?")
+    streamed = assimilate_many((obj for obj in test_objects_subclass_converted), _Ellipse)
+    assert next(streamed) is test_objects_subclass_converted[0]
+    assert test_objects_subclass_converted[0].__class__ is _Ellipse
+    assert test_objects_subclass_converted[-1].__class__ is _AlphaNumeric
+    _assert_seq(list(streamed), test_objects_subclass_converted[1:])
+    print("Nice! Let's test some more attributes on the original circle objects.")
+    return test_objects_original, test_objects_circle
+
+
+def _magic_test(test_objects_circle, test_objects_original):
+    """Test magic method binding, class, and inspection attributes."""
+    print("\n____\nBEGIN MAGIC TESTS")
+    print("First we'll convert to a class with magic methods, and assert a couple common sense identity attrs again.")
+    print("\nConvert To Characters->")
+    plan_stats = transition_plan_stats()
+    test_objects_characters = _convert_seq(test_objects_circle, _AlphaNumeric)
+    print("Did they all follow the same transition plan?")
+    converted_plan_stats = transition_plan_stats()
+    assert converted_plan_stats["misses"] - plan_stats["misses"] <= 1
+    assert sum(converted_plan_stats[key] - plan_stats[key] for key in ("hits", "misses")) == len(test_objects_circle)
+    print("Are they still unique objects with their previous IDs?")
+    _assert_seq(test_objects_characters, assert_val=False)
+    _assert_seq(test_objects_characters, test_objects_circle)
+    _assert_seq(test_objects_characters, test_objects_original)
+
+    print("Does using magic methods implemented in an @assimilated class still work? Let's try an object + 1.")
+    _ = test_objects_characters[0] + 1
+    print("Nice! What happens if we call a magic method on an unbound Borg Pod?")
+    test_object = BorgPod()
+    try:
+        test_object *= 1
+    except AttributeError as e:
+        print("That was close! Here is our error: {}".format(e))
+    else:
+        raise AssertionError("The imul method should have error'd while unbound. Fortunately, I have a spare!")
+    print("Does the unbound instance preserve its docstring?")
+    assert test_object.__doc__ is BorgPod.__doc__
+    print("Does a bound instance properly inherit the bound docstring?")
+    assert test_objects_characters[0].__doc__ is _AlphaNumeric.__doc__
+    assert test_object.__doc__ is not test_objects_characters[0]
+    assert test_object.__doc__ is not test_objects_characters[0].__doc__
+    print("Are their available dirs in line with their classes?")
+    assert ([attr for attr in dir(test_objects_characters[0]) if attr not in {_QUEEN_REF, "shape_type"}]
+            == dir(_AlphaNumeric)), "Did you add more instance methods?"
+    assert ([attr for attr in dir(test_object) if attr not in {_QUEEN_REF, "shape_type"}]
+            == dir(BorgPod)), "Did you add more instance methods?"
+    print("And that means separately bound instance dirs are not the same nor equal, correct?")
+    assert dir(test_objects_characters[0]) is not dir(test_object)
+    assert dir(test_objects_characters[0]) != dir(test_object)
+    print("And that means their respective bound classes evaluate as the same as the module-level class, correct?")
+    assert test_objects_characters[0].__class__ is _AlphaNumeric
+    assert test_object.__class__ is BorgPod
+
+    return test_objects_characters
+
+
+def _the_resistance_test(test_objects_characters):
+    """Test the @resist decorator."""
+    print("\n____\nBEGIN @RESIST DECORATOR TESTS")
+    print("Let's try converting to a class with a @resist decorated method returning 'self'.")
+    print("\nConvert To Punctuations->")
+    test_objects_punctuation = _convert_seq(test_objects_characters, _Punctuation)
+    print("First, let's assert a couple common sense identity attrs again.")
+    print("Are they unique objects?")
+    _assert_seq(test_objects_punctuation, assert_val=False)
+    print("Is equal to character list?")
+    _assert_seq(test_objects_punctuation, test_objects_characters)
+    print("Did their queens become real instances of the generated queen class?")
+    for obj in test_objects_punctuation:
+        assert isinstance(obj, _Punctuation) and isinstance(obj, BorgPod) and type(obj) is not BorgPod
+        assert obj.__class__ is _Punctuation
+
+    print("What if we return self from a method decorated with @resist?")
+    self_list_unprotected = [obj.self_method() for obj in test_objects_punctuation]
+    print("(A method decorated with @resist will not convert 'self' to the queen reference. [not suggested])")
+    print("Are they unique objects?")
+    _assert_seq(self_list_unprotected, assert_val=False)
+    print("Do they no longer evaluate as the same object from the previous punctuation list?")
+    _assert_seq(self_list_unprotected, test_objects_punctuation, assert_val=False)
+    print("What if we retrieve the drones from the previous characters list?")
+    drone_list_characters = [obj.drone for obj in test_objects_characters]
+    print("Does it evaluate as the same to the @resist self list?")
+    _assert_seq(drone_list_characters, self_list_unprotected)
+    print("What if we retrieve the queen from the @resist self list?")
+    self_list_restored = [obj.queen for obj in self_list_unprotected]
+    print("Does it evaluate as the same to the original characters list?")
+    _assert_seq(self_list_restored, test_objects_characters)
+
+
+def _collection_test(num_objects):
+    """Test that dropped borg pods, and every drone they held, are freed by reference counting alone."""
+    print("\n____\nBEGIN COLLECTION TESTS")
+    print("Let's turn off the garbage collector, and make some pods with a few drones each.")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        test_objects = [_Circle() for _ in range(num_objects)]
+        for obj in test_objects[::2]:
+            enable_drone_cache(obj)
+        references = []
+        for new_class in (_AlphaNumeric, _Punctuation):
+            references.extend(weakref.ref(obj.drone) for obj in test_objects)
+            test_objects = _convert_seq(test_objects, new_class)
+        references.extend(weakref.ref(obj.drone) for obj in test_objects)
+        references.extend(weakref.ref(obj) for obj in test_objects)
+        print("Can their drones still find them?")
+        assert all(obj.drone.queen is obj for obj in test_objects)
+        print("Are they all gone once we let go of them?")
+        del obj, test_objects
+        assert all(reference() is None for reference in references), "Something is keeping a borg pod alive!"
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    print("Are throwaway @assimilate classes collected too, once we let go of them and their pods?")
+
+    @assimilate
+    class _Scribble(_PerfectGreekInfluencedChalkDrawingOfFace):
+        """Draws itself through super(), so its method holds the class in a __class__ cell."""
+        def self_method(self):
+            return super().self_method()
+
+    @assimilate(generate_queen=True)
+    class _Doodle(object):
+        """Has a generated queen class."""
+        def __add__(self, other):
+            return other
+
+    @assimilate
+    class _Smudge(object):
+        """Never used, so never prepared."""
+
+    test_object = _Scribble(_Circle())
+    assert test_object.self_method() is test_object
+    list(assimilate_many([test_object, test_object], _Doodle))
+    assert test_object + 1 == 1 and transition_plan_stats()["plans"]
+    references = [weakref.ref(_Scribble), weakref.ref(_Doodle), weakref.ref(_Smudge)]
+    del _Scribble, _Doodle, _Smudge, test_object
+    gc.collect()
+    assert all(reference() is None for reference in references), "Something is keeping an @assimilate class alive!"
+
+
+def _compact_test(num_objects):
+    """Test @assimilate classes with __slots__, which share a fixed layout state with a CompactBorgPod."""
+    print("\n____\nBEGIN COMPACT TESTS")
+    print("Do classes with __slots__ make compact pods?")
+    test_objects_glyphs = [_Glyph(strokes) for strokes in range(num_objects)]
+    _assert_seq(test_objects_glyphs, assert_val=False)
+    for obj in test_objects_glyphs:
+        assert type(obj) is CompactBorgPod and obj.__class__ is _Glyph and not isinstance(vars(obj), dict)
+    print("Is self still the queen?")
+    _assert_seq([obj.self_method() for obj in test_objects_glyphs], test_objects_glyphs)
+    print("\nConvert To Runes->")
+    test_objects_runes = _convert_seq(test_objects_glyphs, _Rune)
+    _assert_seq(test_objects_runes, test_objects_glyphs)
+    print("Did they keep their state, and make room for the new slots?")
+    for strokes, obj in enumerate(test_objects_runes):
+        assert obj.shape_type == "rune" and obj.strokes == strokes and obj.power == strokes * 2
+        assert obj.drone.queen is obj
+    print("Is an attribute without a slot still refused?")
+    try:
+        test_objects_runes[0].colour = "red"
+    except AttributeError as e:
+        print("Refused! Here is our error: {}".format(e))
+    else:
+        raise AssertionError("Compact pods should only take attributes with a slot.")
+    try:
+        del test_objects_runes[0]._pod_state
+    except AttributeError as e:
+        assert "can't delete attribute '_pod_state'" in str(e), "Named, and not mistaken for an unbound pod."
+    else:
+        raise AssertionError("A compact pod's state can't be deleted.")
+
+
+def _forwarding_test(num_objects):
+    """Test that forwarded attributes and redirected operators follow the drone class when it is monkeypatched."""
+    print("\n____\nBEGIN FORWARDING TESTS")
+
+    @assimilate
+    class _Clock(object):
+        """Chimes."""
+        def chime(self):
+            return "dong"
+
+    @assimilate
+    class _CuckooClock(_Clock):
+        """Chimes the way a _Clock does, until it is given its own chime."""
+
+    test_objects = [_Clock() for _ in range(num_objects)]
+    print("Once read, is how to bind drone methods kept on the drone class, leaving BorgPod alone?")
+    assert [obj.chime() for obj in test_objects] == ["dong"] * num_objects
+    assert "chime" in vars(_Clock)[_POD_FORWARDS] and "chime" not in vars(BorgPod) and "chime" not in dir(BorgPod())
+    print("Do they follow the drone class when one of its methods is reassigned?")
+    _Clock.chime = lambda self: "ding"
+    assert [obj.chime() for obj in test_objects] == ["ding"] * num_objects
+    print("...when a subclass shadows the method it inherited, or lets it go again?")
+    test_objects = [_CuckooClock(obj) for obj in test_objects]
+    assert test_objects[0].chime() == "ding"
+    _CuckooClock.chime = lambda self: "cuckoo"
+    assert test_objects[0].chime() == "cuckoo"
+    del _CuckooClock.chime
+    assert test_objects[0].chime() == "ding"
+    print("Do redirected operators follow it too, from missing to reassigned?")
+    try:
+        test_objects[0] + 1
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("A _Clock can't be added to yet.")
+    _Clock.__add__ = lambda self, other: "one"
+    assert test_objects[0] + 1 == "one"
+    _Clock.__add__ = lambda self, other: "two"
+    assert test_objects[0] + 1 == "two"
+    print("...and when it is deleted?")
+    del _Clock.chime
+    assert not hasattr(test_objects[0], "chime")
+    _clear_forwarding_cache()
+    assert _POD_FORWARDS not in vars(_Clock)
+    print("Do assimilated subclasses see an undecorated base class's methods reassigned, or patched?")
+
+    class _Bell(object):
+        def ring(self):
+            return "old", self
+
+    @assimilate
+    class _HandBell(_Bell):
+        pass
+
+    @assimilate(generate_queen=True)
+    class _DoorBell(_Bell):
+        pass
+
+    test_objects = [_HandBell(), _DoorBell()]
+    assert [obj.ring() for obj in test_objects] == [("old", obj) for obj in test_objects]
+    _Bell.ring = lambda self: ("new", self)
+    assert [obj.ring() for obj in test_objects] == [("new", obj) for obj in test_objects], "Still given the queen."
+    assert wrap_depth(_HandBell.ring) == 1 and wrap_depth(_Bell.ring) == 0
+    with mock.patch.object(_Bell, "ring", return_value="patched"):
+        assert [obj.ring() for obj in test_objects] == ["patched", "patched"]
+    assert test_objects[0].ring() == ("new", test_objects[0])
+
+
+@assimilate
+class _Polygon(object):
+    """A shape with straight sides, whose measurements are worth remembering."""
+    def __init__(self, sides=3, length=1.0):
+        self.sides = sides
+        self.length = length
+
+    @borg_cached(watch=("sides", "length"))
+    def area(self):
+        return self.sides * self.length ** 2 / (4 * math.tan(math.pi / self.sides))
+
+    @borg_cached(maxsize=2)
+    def perimeter(self, scale=1):
+        return self.sides * self.length * scale
+
+
+def _borg_cached_test(num_objects):
+    """Test memoized drone methods, and what invalidates them."""
+    print("\n____\nBEGIN BORG CACHED TESTS")
+
+    @assimilate(generate_queen=True)
+    class _Sundial(object):
+        """A generate_queen class, whose queen type is generated before there are any set hooks."""
+        def __init__(self):
+            self.hour = 12
+
+        @borg_cached(watch=("hour",))
+        def angle(self):
+            return self.hour * 15.0
+
+    sundial = _Sundial()
+    print("Are results remembered per pod?")
+    test_objects = [_Polygon(3 + index) for index in range(num_objects)]
+    areas = [test_object.area() for test_object in test_objects]
+    assert [test_object.area() for test_object in test_objects] == areas
+    assert _Polygon.area.cache_info() == {"hits": num_objects, "misses": num_objects, "size": num_objects,
+                                          "maxsize": DEFAULT_BORG_CACHE_SIZE}
+    print("Are they forgotten when a watched attribute changes, through the queen or a drone?")
+    test_objects[0].sides = 12
+    test_objects[1].drone.length = 2.0
+    test_objects[2].color = "red"
+    assert test_objects[0].area() != areas[0] and test_objects[1].area() == 4 * areas[1]
+    assert test_objects[2].area() == areas[2] and _Polygon.area.cache_info()["misses"] == num_objects + 2
+    print("...or when the pod is converted?")
+    _Polygon(_Circle(test_objects[3]), 3)
+    assert test_objects[3].area() == areas[0] and _Polygon.area.cache_info()["misses"] == num_objects + 3
+    print("Do the methods hold no more than maxsize results, and let go of pods as they are collected?")
+    assert [test_object.perimeter() for test_object in test_objects][:2] == [12.0, 8.0]
+    assert test_objects[-1].perimeter(2) == 2 * test_objects[-1].perimeter()
+    assert _Polygon.perimeter.cache_info()["size"] == 2
+    print("...and through generated queen classes, even those generated before anything was watched?")
+    assert sundial.angle() == 180.0
+    sundial.hour = 6
+    assert sundial.angle() == 90.0, "Set through a generated queen."
+    del test_objects, areas, sundial
+    assert _Polygon.area.cache_info()["size"] == _Polygon.perimeter.cache_info()["size"] == 0
+    assert not _SET_HOOKS and "__setattr__" not in vars(BorgPod), "No watched results, so no set hooks."
+    assert all(queen_class.__setattr__ is object.__setattr__ for queen_class, queen_base in _QUEEN_BASES.items()
+               if queen_base is BorgPod), "Generated queen classes let go of the hooks too."
+    _Polygon.area.cache_clear()
+    _Polygon.perimeter.cache_clear()
+
+
+def _dirty_tracking_test(num_objects):
+    """Test recording which pods had attributes set since their last checkpoint."""
+    print("\n____\nBEGIN DIRTY TRACKING TESTS")
+    test_objects = [_Polygon(3 + index) for index in range(num_objects)]
+    assert not dirty_pods([_Circle(test_objects[-1])]), "Nothing is recorded until tracking is enabled."
+    enable_dirty_tracking()
+    try:
+        print("Which pods changed, and how?")
+        test_objects[0].sides = 4
+        test_objects[1].drone.length = 2.0
+        _Circle(test_objects[2])
+        assert dirty_attributes(test_objects[0]) == {"sides"}
+        assert dirty_pods(test_objects, clear=True) == {
+            test_objects[0]: {"sides"}, test_objects[1]: {"length"}, test_objects[2]: {CLASS_CHANGE, "shape_type"}
+        }
+        assert not dirty_pods(test_objects), "Checkpointed."
+        compact_object = _Glyph()
+        assert dirty_attributes(compact_object, clear=True) == {CLASS_CHANGE, "shape_type", "strokes"}
+        compact_object.strokes = 2
+        assert dirty_attributes(compact_object) == {"strokes"}
+        del compact_object, test_objects
+        assert not _DIRTY_PODS, "Collected pods are forgotten."
+    finally:
+        disable_dirty_tracking()
+    assert not _SET_HOOKS and "__setattr__" not in vars(BorgPod)
+    assert not dirty_attributes(_Circle(_Polygon())), "Conversions are marked by plans, which are made again."
+    print("Do drone setters run the hooks only while there are any, and once through a subclass's?")
+    set_names = []
+    rune = _Rune(_Glyph(2))
+    _add_set_hook(lambda queen, name: set_names.append(name))
+    try:
+        rune.drone.strokes = 5
+    finally:
+        _remove_set_hook(_SET_HOOKS[0])
+    rune.drone.strokes = 6
+    assert set_names == ["strokes"] and rune.strokes == 6 and hasattr(vars(_Rune)["__setattr__"], "_pod_hooked")
+    assert all(plan[-1] is None for plans in vars(_Circle)[_POD_TRANSITION_PLANS].values() for plan in plans.values())
+
+
+def _snapshot_test(num_objects):
+    """Test rolling pods back from speculative conversions."""
+    print("\n____\nBEGIN SNAPSHOT TESTS")
+    print("Can we take back a conversion, and everything set since?")
+    test_object = _Polygon(5, 2.0)
+    taken = snapshot(test_object)
+    test_object.sides = 6
+    test_object.color = "blue"
+    assert _Circle(test_object) is test_object and test_object.shape_type == "circle"
+    assert set(taken.saved) == {"sides", "color", "shape_type"}, "Only what changed is saved."
+    assert rollback(test_object, taken) is test_object and type(test_object.drone) is _Polygon
+    assert test_object.sides == 5 and test_object.length == 2.0 and test_object.__doc__ == _Polygon.__doc__
+    assert not hasattr(test_object, "color") and not hasattr(test_object, "shape_type")
+    print("...and nested ones, and compact ones?")
+    outer = snapshot(test_object)
+    test_object.sides = 7
+    inner = snapshot(test_object)
+    test_object.sides = 8
+    del test_object.length
+    assert rollback(test_object, inner).sides == 7 and test_object.length == 2.0
+    assert rollback(test_object, outer).sides == 5
+    compact_object = _Glyph(3)
+    taken = snapshot(compact_object)
+    _Rune(compact_object)
+    compact_object.strokes = 4
+    rollback(compact_object, taken)
+    assert type(compact_object.drone) is _Glyph and compact_object.strokes == 3 and compact_object.shape_type == "glyph"
+    assert not hasattr(compact_object._pod_state, "power")
+    print("...and for many pods at once?")
+    test_objects = [_Polygon(3 + index) for index in range(num_objects)]
+    snapshots = snapshot_many(test_objects)
+    for test_object in test_objects[::2]:
+        _Circle(test_object)
+    rollback_many(test_objects, snapshots)
+    assert all(type(test_object.drone) is _Polygon and not hasattr(test_object, "shape_type")
+               for test_object in test_objects)
+    try:
+        rollback(test_objects[0], snapshots[1])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Rolled back to another pod's snapshot.")
+    del taken, outer, inner, snapshots
+    assert not _SNAPSHOTS and not _SET_HOOKS, "Dropped snapshots stop saving values."
+
+
+def _serialization_test(num_objects):
+    """Test pickling and copying pods."""
+    print("\n____\nBEGIN SERIALIZATION TESTS")
+    print("Do pods pickle as their attributes, and keep their identity?")
+    test_objects = [_Polygon(3 + index) for index in range(num_objects)]
+    test_objects[0].me = test_objects[0]
+    test_objects[0].others = test_objects[1:]
+    data = pickle.dumps(test_objects + test_objects)
+    assert _QUEEN_REF.encode() not in data and b"_active_class" not in data
+    loaded = pickle.loads(data)
+    assert loaded[:num_objects] == loaded[num_objects:] and loaded[0].me is loaded[0]
+    assert loaded[0].others == loaded[1:num_objects] and loaded[0] is not test_objects[0]
+    assert all(type(pod.drone) is _Polygon and pod.sides == 3 + index and pod.__doc__ == _Polygon.__doc__
+               for index, pod in enumerate(loaded[:num_objects]))
+    generated_object = pickle.loads(pickle.dumps(_Punctuation()))
+    assert type(generated_object) is _generated_queen_class(BorgPod, _Punctuation) and generated_object.queen
+    compact_object = _Glyph(2)
+    _Rune(compact_object).power = 9
+    _Glyph(compact_object)
+    compact_object = pickle.loads(pickle.dumps(compact_object))
+    assert type(compact_object.drone) is _Glyph and compact_object._pod_state.power == 9
+    print("Do drones pickle as their pod's drone?")
+    loaded = pickle.loads(pickle.dumps([test_objects[1], test_objects[1].drone, compact_object.drone]))
+    assert loaded[1] is loaded[0].drone and loaded[1].queen is loaded[0] and loaded[2].strokes == 1
+    assert loaded[2].queen is None, "Loaded without its pod, which nothing else held."
+    stale_drone = test_objects[2].drone
+    _Circle(test_objects[2])
+    try:
+        pickle.dumps(stale_drone)
+        assert False, "Only a pod's current drone can be pickled as its drone."
+    except TypeError:
+        _Polygon(test_objects[2])
+    print("Do copies share (or deep copy) attributes?")
+    shallow = copy.copy(test_objects[0])
+    deep = copy.deepcopy(test_objects[0])
+    assert shallow.others is test_objects[0].others and shallow.me is test_objects[0] and shallow.sides == 3
+    assert deep.me is deep and deep.others[0].sides == 4 and deep.others[0] is not test_objects[1]
+    assert copy.copy(compact_object).strokes == 1 and copy.copy(compact_object) is not compact_object
+    shallow = copy.copy(test_objects[0].drone)
+    assert type(shallow) is _Polygon and shallow.queen is None and shallow.others is test_objects[0].others
+    deep = copy.deepcopy([test_objects[1], test_objects[1].drone])
+    assert deep[1] is deep[0].drone and deep[0] is not test_objects[1], "Copied as its pod's drone."
+    print("Are big buffers passed out-of-band under protocol 5?")
+    test_objects[1].pixels = test_objects[2].pixels = bytearray(OUT_OF_BAND_MIN_BYTES)
+    buffers = []
+    data = pickle.dumps(test_objects[1:3], protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1 and len(data) < OUT_OF_BAND_MIN_BYTES
+    loaded = pickle.loads(data, buffers=buffers)
+    assert loaded[0].pixels is loaded[1].pixels and loaded[0].pixels == test_objects[1].pixels
+    assert type(pickle.loads(pickle.dumps(test_objects[1], protocol=5)).pixels) is bytearray
+
+
+def _metrics_test(num_objects):
+    """Test counting conversions, forwarded lookups and redirected magic methods."""
+    print("\n____\nBEGIN METRICS TESTS")
+    print("Can we count what pods get up to, and only keep some of the events?")
+    unmetered_getattr = BorgPod.__dict__["__getattr__"]
+    assert _AlphaNumeric().info is not None, "Resolved for the class before metrics are enabled."
+    enable_metrics(events=3, sample_every=2)
+    try:
+        test_objects = [_Circle() for _ in range(num_objects)]
+        _convert_seq(test_objects, _Ellipse)
+        _convert_seq(test_objects, _AlphaNumeric)
+        assert all(test_objects[0].info is test_objects[1].info for _ in range(5)) and test_objects[0] + 1 == 1
+        taken = metrics_snapshot(clear=True)
+        assert taken["conversions"] == {_Circle: num_objects, _Ellipse: num_objects, _AlphaNumeric: num_objects}
+        assert taken["transitions"][None, _Circle] == taken["transitions"][_Ellipse, _AlphaNumeric] == num_objects
+        assert taken["forwarded"] == {(_AlphaNumeric, "info"): 10}, "Every read, however it was resolved."
+        assert taken["magic"] == {(_AlphaNumeric, "__add__"): 1}
+        assert len(taken["events"]) == 3 and taken["events"][-1][1:] == (id(test_objects[-1]), _Ellipse, _AlphaNumeric)
+        assert all(event[2:] == (_Ellipse, _AlphaNumeric) for event in taken["events"]), "Only the latest are held."
+        assert not any(metrics_snapshot().values()), "Cleared."
+        print("...and stop, leaving nothing behind?")
+    finally:
+        disable_metrics()
+    _Circle(test_objects[0])
+    assert not any(metrics_snapshot().values()) and BorgPod.__dict__["__getattr__"] is unmetered_getattr
+    assert all(plan[-1] is None for plans in vars(_Circle)[_POD_TRANSITION_PLANS].values() for plan in plans.values())
+
+
+def _thread_safety_test(num_objects, rounds=3000):
+    """Test converting the same pods from many threads at once while other threads read them."""
+    print("\n____\nBEGIN THREAD SAFETY TESTS")
+    print("Do pods converted from many threads at once come out whole, and can they be read all the while?")
+    dict_classes = (_AlphaNumeric, _Circle, _Punctuation)
+    test_objects = [_AlphaNumeric() for _ in range(num_objects)]
+    compact_objects = [_Glyph(2) for _ in range(num_objects)]
+    failures = []
+    converting = threading.Event()
+
+    def convert(seed):
+        try:
+            for step in range(rounds):
+                dict_classes[(seed + step * 7) % 3](test_objects[(seed + step) % num_objects])
+                (_Glyph, _Rune)[(seed + step) % 2](compact_objects[(seed * 3 + step) % num_objects])
+        except Exception as error:
+            failures.append(error)
+
+    def read():
+        try:
+            while converting.is_set():
+                for test_object, compact_object in zip(test_objects, compact_objects):
+                    assert str(test_object) and test_object.shape_type
+                    assert compact_object.strokes and compact_object.drone._pod_state is compact_object._pod_state
+        except Exception as error:
+            failures.append(error)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible, to hit any window between steps.
+    enable_class_index()
+    try:
+        converting.set()
+        threads = [threading.Thread(target=convert, args=(seed,)) for seed in range(4)]
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for thread in readers + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        converting.clear()
+        for thread in readers:
+            thread.join()
+        assert not failures, failures
+        for test_object in test_objects:
+            drone_class = type(test_object.drone)
+            assert type(test_object) is (_generated_queen_class(BorgPod, _Punctuation) if drone_class is _Punctuation
+                                         else BorgPod), "The queen's type matches its drone."
+            assert test_object.drone.__dict__ is test_object.__dict__
+        for compact_object in compact_objects:
+            assert compact_object.drone._pod_state is compact_object._pod_state
+        for drone_class in dict_classes + (_Glyph, _Rune):
+            assert set(map(id, pods_of(drone_class))) == {
+                id(test_object) for test_object in test_objects + compact_objects
+                if isinstance(test_object.drone, drone_class)
+            }, "The class index agrees with every pod."
+    finally:
+        disable_class_index()
+        sys.setswitchinterval(switch_interval)
+
+
+def _class_index_test(num_objects):
+    """Test finding pods by their current class through the class index."""
+    print("\n____\nBEGIN CLASS INDEX TESTS")
+    enable_class_index()
+    try:
+        print("Can we find every circle without asking each pod what it is?")
+        test_objects_circle = [_Circle() for _ in range(num_objects)]
+        test_objects_ellipse = [_Ellipse() for _ in range(num_objects)]
+        assert pod_count(_Ellipse) == num_objects and pod_count(_Circle) == 2 * num_objects
+        assert set(map(id, pods_of(_Circle))) == set(map(id, test_objects_circle + test_objects_ellipse))
+        print("Does the index follow them when they convert?")
+        _convert_seq(test_objects_ellipse, _AlphaNumeric)
+        assert pod_count(_Ellipse) == 0 and pod_count(_Circle) == pod_count(_AlphaNumeric) == num_objects
+        print("Does the index let go of them when we do?")
+        del test_objects_circle, test_objects_ellipse
+        assert pod_count(_Circle) == pod_count(_AlphaNumeric) == 0 and not pods_of(_Circle)
+    finally:
+        disable_class_index()
+
+
+def _lazy_test(num_objects):
+    """Test that lazily decorated classes are finished off by whichever use comes first."""
+    print("\n____\nBEGIN LAZY DECORATION TESTS")
+
+    @assimilate
+    class _Sketch(_PerfectGreekInfluencedChalkDrawingOfFace):
+        def __init__(self):
+            super().__init__()
+            self.shape_type = "sketch"
+
+    @assimilate
+    class _Shading(_Sketch):
+        def __new__(cls, *args, **kwargs):
+            return super().__new__(cls, *args, **kwargs)
+
+        def __init__(self):
+            self.shape_type = "shading"
+
+        def shade(self):
+            return self
+
+    @assimilate(lazy=False)
+    class _Outline(_Sketch):
+        pass
+
+    print("Are the classes left alone until they are needed?")
+    assert _POD_PENDING_PREPARATION not in vars(_Sketch) and _POD_PENDING_PREPARATION not in vars(_Outline)
+    assert _POD_PENDING_PREPARATION in vars(_Shading) and "__setattr__" not in vars(_Shading)
+    assert wrap_depth(_Shading.shade) == 0 and wrap_depth(_Shading.self_method) == 1, "Not wrapped until used."
+    print("Does a subclass's super().__new__ still find the queen?")
+    test_objects = [_Circle() for _ in range(num_objects)]
+    assert _Shading(test_objects[0]) is test_objects[0] and test_objects[0].shape_type == "shading"
+    assert _POD_PENDING_PREPARATION not in vars(_Shading) and test_objects[0].self_method() is test_objects[0]
+    assert wrap_depth(_Shading.shade) == 1 and test_objects[0].shade() is test_objects[0]
+
+    @assimilate
+    class _Erasure(_Shading):
+        def __init__(self):
+            self.shape_type = "erased"
+
+    print("Does converting many at once prepare the class too?")
+    assert [pod.shape_type for pod in assimilate_many(test_objects[1:], _Erasure)] == ["erased"] * (num_objects - 1)
+    assert _POD_PENDING_PREPARATION not in vars(_Erasure) and isinstance(test_objects[-1], _Shading)
+
+
+def _spawn_test(num_objects):
+    """Test that spawn_many makes pods just as calling the class for each one would."""
+    print("\n____\nBEGIN SPAWN TESTS")
+
+    def pod_state(pod):
+        state = vars(pod)
+        if isinstance(state, dict):
+            return type(pod), type(pod.drone), {name: value for name, value in state.items() if name != _QUEEN_REF}
+        return type(pod), type(pod.drone), type(state), {name: state.get(name) for name in state._pod_layout}
+
+    enable_class_index()
+    enable_dirty_tracking()
+    try:
+        print("Do spawned pods come out as if each was made on its own?")
+        for new_class, args, kwargs in (
+                (_Circle, (), {}), (_Punctuation, (), {}), (_Glyph, (3,), {}), (_Polygon, (), {"sides": 4}),
+        ):
+            spawned = spawn_many(new_class, num_objects, *args, **kwargs)
+            called = [new_class(*args, **kwargs) for _ in range(num_objects)]
+            assert list(map(pod_state, spawned)) == list(map(pod_state, called))
+            assert all(pod.drone.queen is pod and vars(pod).get(_QUEEN_REF)() is pod for pod in spawned)
+            assert list(map(dirty_attributes, spawned)) == list(map(dirty_attributes, called))
+            assert CLASS_CHANGE in dirty_attributes(spawned[0])
+            assert pod_count(new_class) == 2 * num_objects and len(set(map(id, spawned + called))) == 2 * num_objects
+            del spawned, called
+    finally:
+        disable_dirty_tracking()
+        disable_class_index()
+    print("...even when the queen class has a mixin whose __init__ is called cooperatively?")
+
+    class _Mixin(object):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.mixed = True
+
+    class _MixedPod(BorgPod, _Mixin):
+        pass
+
+    @assimilate(default_class=_MixedPod)
+    class _Blend(object):
+        pass
+
+    assert [pod_state(pod) for pod in spawn_many(_Blend, 2)] == [pod_state(_Blend()) for _ in range(2)]
+    assert spawn_many(_Blend, 1)[0].mixed
+    print("Is a pod among the arguments just an argument?")
+    argument = _Circle()
+    polygons = spawn_many(_Polygon, 2, argument)
+    assert polygons[0].sides is polygons[1].sides is argument and argument.drone.__class__ is _Circle
+    assert spawn_many(_Circle, 0) == []
+    for new_class, number, error in (
+            (_PerfectGreekInfluencedChalkDrawingOfFace, 1, TypeError), (_Circle, -1, ValueError),
+    ):
+        try:
+            spawn_many(new_class, number)
+        except error:
+            pass
+        else:
+            raise AssertionError("Only @assimilate classes can be spawned, and no fewer than none of them.")
+
+
+def _pod_containers_test(num_objects=6):
+    """PodSet and PodDict hold the same pods a set and dict would, without calling the pods' __hash__ or __eq__."""
+    print("\n____\nBEGIN POD CONTAINER TESTS")
+    test_objects = [_Circle() for _ in range(num_objects)]
+    _convert_seq(test_objects[::2], _Ellipse)
+    test_objects[1] = _AlphaNumeric(test_objects[1])
+    circles = PodSet(test_objects)
+    assert len(circles) == num_objects and circles == set(test_objects) and list(circles) == test_objects
+    assert all(pod in circles for pod in test_objects) and _Circle() not in circles and 1 not in circles
+    print("Do the set operations agree with a set's?")
+    evens, firsts = PodSet(test_objects[::2]), PodSet(test_objects[:3])
+    for pod_set, expected in (
+            (evens | firsts, set(test_objects[::2]) | set(test_objects[:3])),
+            (evens & firsts, set(test_objects[::2]) & set(test_objects[:3])),
+            (evens - firsts, set(test_objects[::2]) - set(test_objects[:3])),
+            (evens ^ firsts, set(test_objects[::2]) ^ set(test_objects[:3])),
+            (circles.difference(test_objects[1:], [1]), {test_objects[0]}),
+            (evens & {1, test_objects[0]}, {test_objects[0]}),
+    ):
+        assert type(pod_set) is PodSet and pod_set == expected
+    assert evens <= circles and not evens >= circles and evens.isdisjoint(test_objects[1::2])
+    print("...and with a set of anything on the left?")
+    others = {1, test_objects[0], test_objects[1]}
+    for result, expected in (
+            (others - evens, others - set(evens)), (others & evens, others & set(evens)),
+            (others | evens, others | set(evens)), (others ^ evens, others ^ set(evens)),
+            (set(test_objects[:2]) - evens, {test_objects[1]}),
+    ):
+        assert result == expected and type(result) is (PodSet if 1 not in expected else set)
+    print("Can we pick out the ellipses without asking each pod what it is?")
+    assert circles.of_class(_Ellipse) == set(test_objects[::2]) and not circles.of_class(_Punctuation)
+    assert circles.of_class(_Circle) == set(test_objects) - {test_objects[1]}
+    circles -= evens
+    circles.discard(test_objects[1])
+    assert circles == set(test_objects[3::2])
+    assert [pod.shape_type for pod in pickle.loads(pickle.dumps(circles))] == ["circle"] * len(circles)
+    print("Can we key a dict by pods the same way?")
+    shapes = PodDict((pod, pod.shape_type) for pod in test_objects)
+    assert len(shapes) == num_objects and dict(shapes) == {pod: pod.shape_type for pod in test_objects}
+    assert shapes[test_objects[0]] == "ellipse" and shapes.get(_Circle()) is None and list(shapes) == test_objects
+    shapes[test_objects[0]] = "oval"
+    del shapes[test_objects[2]]
+    assert shapes.pop(test_objects[3]) == "circle" and test_objects[3] not in shapes and len(shapes) == num_objects - 2
+    assert list(shapes.of_class(_Ellipse).items()) == [(test_objects[0], "oval")] + [
+        (pod, "ellipse") for pod in test_objects[4::2]]
+    assert PodDict.fromkeys(evens, 0) == dict.fromkeys(evens, 0) and PodSet(shapes) == set(shapes)
+    for bad_call in (
+            lambda: PodSet([1]), lambda: evens.add("pod"), lambda: shapes.__setitem__(1, 1), lambda: evens | {1}
+    ):
+        try:
+            bad_call()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Expected TypeError.")
+    print("Pod Containers Test Complete")
+
+
+@assimilate
+class _Pixel(object):
+    """A pixel of an image, which only knows how bright it is."""
+    __slots__ = ("red", "label")
+
+    def __init__(self, red=0):
+        self.red = red
+        self.label = "pixel"
+
+    def describe(self):
+        return "{} {}".format(self.label, self.red)
+
+
+@assimilate
+class _EdgePixel(_Pixel):
+    """A pixel which turned out to be on an edge, and so has a strength too."""
+    __slots__ = ("strength",)
+
+    def __init__(self, red=255):
+        super().__init__(red)
+        self.label = "edge"
+        self.strength = 1.0
+
+
+@assimilate
+class _DictPixel(object):
+    """A pixel without __slots__, which can't be stored in a PodArray."""
+    def __init__(self):
+        self.red = 0
+
+
+def _pod_array_test():
+    """Views, identity, and whole-column reads, writes and conversions."""
+    pixels = PodArray(_Pixel, 10, typecodes={"red": "B"})
+    assert len(pixels) == 10 and pixels.get("red") == array("B", [0] * 10)
+    assert pixels.get("label") == [None] * 10, "__init__ isn't run for the initial pods."
+    pixels.set("red", range(10))
+    pixels.fill("label", "pixel")
+    view = pixels[3]
+    assert view is pixels[3] is pixels[-7] and isinstance(view, _Pixel) and isinstance(view, CompactBorgPod)
+    assert view.red == 3 and view.describe() == "pixel 3"
+    view.red = 200
+    view.label = "three"
+    assert pixels.get("red")[3] == 200 and pixels.column("label")[3] == "three"
+
+    # Converting a view converts the pod, which gets a column for its new attribute.
+    assert _EdgePixel(view) is view and pixels.class_of(3) is _EdgePixel
+    assert view.red == 255 and view.strength == 1.0 and pixels.get("strength")[3] == 1.0
+    del view.strength
+    assert pixels.get("strength")[3] is None
+    del view
+    assert not pixels._views, "Nothing else holds a view."
+    assert pixels[3].describe() == "edge 255" and pixels.class_of(3) is _EdgePixel, "The state is in the columns."
+    detached = copy.copy(pixels[3])
+    detached.red = 7
+    assert type(detached) is CompactBorgPod and isinstance(detached, _EdgePixel) and pixels.get("red")[3] == 255
+
+    # Whole-column conversion, with and without __init__.
+    bright = [red > 5 for red in pixels.get("red")]
+    kept_view = pixels[9]
+    pixels.convert(_EdgePixel, bright)
+    assert pixels.mask(_EdgePixel) == bright and pixels.mask(_Pixel) == [True] * 10
+    assert isinstance(kept_view, _EdgePixel) and kept_view.label == "pixel", "Converted without __init__."
+    pixels.fill("strength", 0.5, bright)
+    assert pixels.get("strength", bright) == [0.5] * 5 and pixels[8].strength == 0.5
+    pixels.convert(_Pixel, pixels.mask(_EdgePixel), init=True)
+    assert pixels.mask(_EdgePixel) == [False] * 10 and type(kept_view.drone) is _Pixel
+    assert pixels.get("red", bright) == array("B", [0] * 5) and kept_view.label == "pixel"
+    pixels.set("red", [1, 2], [index in (0, 1) for index in range(10)])
+    assert pixels.get("red")[:3] == array("B", [1, 2, 2])
+
+    # Bulk writes run the set hooks for the views they write through.
+    first = pixels[0]
+    enable_dirty_tracking()
+    try:
+        pixels.set("red", range(10))
+        pixels.fill("label", "bulk", [index != 0 for index in range(10)])
+        assert dirty_attributes(first) == {"red"} and dirty_attributes(kept_view) == {"red", "label"}
+    finally:
+        disable_dirty_tracking()
+    taken = snapshot(first)
+    pixels.fill("red", 9)
+    assert rollback(first, taken).red == 0 and pixels.get("red")[:2] == array("B", [0, 9])
+
+    for bad_call, error in (
+            (lambda: PodArray(_DictPixel, 1), TypeError), (lambda: pixels.convert(_DictPixel), TypeError),
+            (lambda: pixels[10], IndexError), (lambda: pixels.column("blue"), AttributeError),
+            (lambda: pixels.set("red", [1]), ValueError), (lambda: pixels.get("red", [True]), ValueError),
+    ):
+        try:
+            bad_call()
+        except error:
+            pass
+        else:
+            raise AssertionError("Expected {}.".format(error.__name__))
+    print("PodArray Test Complete")
+
+
+@assimilate
+class _Particle(object):
+    """A particle, which may turn out to be moving fast enough to deserve its own class."""
+    def __init__(self, speed=0.0):
+        self.speed = speed
+        self.kind = "particle"
+
+
+@assimilate
+class _FastParticle(_Particle):
+    """A particle which is moving fast."""
+    def __init__(self):
+        self.kind = "fast"
+
+
+def _find_fast(handle, start, stop, limit):
+    """A worker: which of the particles in [start, stop) are faster than limit, read from shared memory."""
+    with SharedPodStore.attach(handle) as columns:
+        speeds = columns["speed"]
+        return [(index, _FastParticle) for index in range(start, stop) if speeds[index] > limit]
+
+
+def _shared_store_test(num_objects=6):
+    """Workers decide pods' classes from shared memory, and the pods are converted here."""
+    particles = [_Particle(float(index)) for index in range(num_objects)]
+    particles[0].speed = 10.0
+    with SharedPodStore(particles, {"speed": "d", "missing": "q"}) as store:
+        assert len(pickle.dumps(store.handle())) < 200 and list(store.columns["missing"]) == [0] * num_objects
+        middle = num_objects // 2
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(_find_fast, store.handle(), start, stop, 2.5)
+                       for start, stop in ((0, middle), (middle, num_objects))]
+            transitions = [transition for future in futures for transition in future.result()]
+        assert store.apply(transitions) == num_objects - 2
+        kinds = ["fast", "particle", "particle"] + ["fast"] * (num_objects - 3)
+        assert [particle.kind for particle in particles] == kinds
+        assert store.pods[0] is particles[0] and isinstance(particles[0], _FastParticle)
+        assert store.apply([(2, _FastParticle), (2, _Particle), (2, _FastParticle)]) == 3
+        assert particles[2].kind == "fast", "Converted in order, so the last transition wins."
+        particles[1].speed = 20.0
+        store.refresh([1])
+        assert store.columns["speed"][1] == 20.0
+        with SharedPodStore.attach(store.handle()) as columns:
+            assert columns["speed"][0] == 10.0
+    assert store._memory is None
+    failed_stores = []
+
+    class _FailingStore(SharedPodStore):
+        def refresh(self, indices=None):
+            failed_stores.append(self)
+            raise MemoryError("Out of room for the columns.")
+
+    try:
+        _FailingStore(particles, {"speed": "d"})
+        assert False, "refresh raised."
+    except MemoryError:
+        assert failed_stores[0]._memory is None and not failed_stores[0].columns, "Freed, as no one else can."
+    print("Shared Store Test Complete")
+
+
+def main(num_objects=6):
+    """
+    Run some assertion tests and prints to demonstrate that you too can have easy, dynamic classes in existing
+        infrastructure!
+
+    :Parameters:
+        :param int num_objects: The length of the list of test objects to be created.
+    :rtype: None
+    :return: None
+    """
+    print("\n____\nBEGIN TESTS\nLet's run some assertion tests and print some examples.")
+    _the_resistance_test(_magic_test(*_identity_crisis_test(num_objects)))
+    _collection_test(num_objects)
+    _compact_test(num_objects)
+    _forwarding_test(num_objects)
+    _class_index_test(num_objects)
+    _lazy_test(num_objects)
+    _borg_cached_test(num_objects)
+    _dirty_tracking_test(num_objects)
+    _snapshot_test(num_objects)
+    _serialization_test(num_objects)
+    _metrics_test(num_objects)
+    _thread_safety_test(num_objects)
+    _spawn_test(num_objects)
+    _pod_containers_test(num_objects)
+    _pod_array_test()
+    _shared_store_test()
+    print("\nTests Complete\n____")
+
+
+if __name__ == "__main__":
+    main()
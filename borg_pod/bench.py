@@ -0,0 +1,788 @@
+"""
+Timing harness for borg pod operations, against plain object baselines. Run with: python -m borg_pod.bench
+
+Pass --json results.json to save the results, and --compare results.json on a later run to report (and exit 1 on) any
+    timing which got slower by more than --threshold.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from . import borg_pod as _borg_pod
+from .borg_pod import (
+    assimilate, assimilate_many, spawn_many, resist, enable_drone_cache, enable_class_index, disable_class_index,
+    pods_of, pod_count, enable_metrics, disable_metrics,
+)
+from .pod_array import PodArray
+from .pod_containers import PodDict, PodSet
+from .shared_store import SharedPodStore
+
+
+@assimilate
+class _BenchDrone(object):
+    """A small @assimilate class with one of each kind of forwarded attribute."""
+    def __init__(self):
+        self.value = 1
+
+    def method(self):
+        return self.value
+
+    @staticmethod
+    def static_method():
+        return 1
+
+
+@assimilate(generate_queen=True)
+class _GeneratedBenchDrone(object):
+    """_BenchDrone, but with a generated queen class."""
+    def __init__(self):
+        self.value = 1
+
+    def method(self):
+        return self.value
+
+    @staticmethod
+    def static_method():
+        return 1
+
+
+class _BenchParent(object):
+    """An undecorated parent of an @assimilate class, whose own instances stay unassimilated."""
+    def parent_method(self):
+        return self
+
+
+@assimilate
+class _SelfAccessDrone(_BenchParent):
+    """One wrapped and one @resist method."""
+    def wrapped_method(self):
+        return self
+
+    @resist
+    def resisted_method(self):
+        return self
+
+
+class _PlainBaseline(object):
+    """The same class without the borg pod, as a baseline."""
+    def __init__(self):
+        self.value = 1
+
+    def method(self):
+        return self.value
+
+    @staticmethod
+    def static_method():
+        return 1
+
+
+class _PlainOther(object):
+    """A second plain class, which a _PlainBaseline can be converted to by assigning its __class__."""
+    def __init__(self):
+        self.value = 2
+
+
+class _PlainNumber(object):
+    """Implements __add__ only - every other operator falls through to the other operand."""
+    def __init__(self):
+        self.value = 1
+
+    def __add__(self, other):
+        return self.value + other
+
+
+_NumberDrone = assimilate(type("_NumberDrone", (_PlainNumber,), {"__doc__": _PlainNumber.__doc__}))
+_GeneratedNumberDrone = assimilate(
+    type("_GeneratedNumberDrone", (_PlainNumber,), {"__doc__": _PlainNumber.__doc__}), generate_queen=True
+)
+
+
+class _ReflectedOperand(object):
+    """Right hand operand which handles the operators _PlainNumber doesn't."""
+    def __rmul__(self, other):
+        return 1
+
+    def __rsub__(self, other):
+        return 1
+
+
+@assimilate
+class _ArgumentDrone(object):
+    """Takes any constructor arguments, to time finding the queen among them."""
+    def __init__(self, *args):
+        pass
+
+
+class _PlainPoint(object):
+    """Two attributes, without the borg pod, as a baseline."""
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+
+
+_DictPoint = assimilate(type("_DictPoint", (_PlainPoint,), {"__doc__": _PlainPoint.__doc__}))
+
+
+@assimilate
+class _SlotPoint(object):
+    """The same two attributes in compact mode."""
+    __slots__ = ("x", "y")
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+
+
+@assimilate
+class _FarPoint(_SlotPoint):
+    """A _SlotPoint which turned out to be far from the origin. Converting to it keeps the coordinates."""
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+
+def _ns_per_call(statement, namespace, number, repeat=5):
+    """Best-of-repeat nanoseconds per execution of statement."""
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat)) / number * 1e9
+
+
+def forwarding_benchmark(number=100000):
+    """
+    Compare forwarded attribute reads on a pod with and without the forwarding cache against a plain instance.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (plain ns, uncached pod ns, cached pod ns)} per call.
+    """
+    namespace = {"pod": _BenchDrone(), "plain": _PlainBaseline()}
+    statements = ("{}.method", "{}.method()", "{}.static_method")
+    enabled = _borg_pod.FORWARDING_CACHE_ENABLED
+    results = {}
+    try:
+        _borg_pod.FORWARDING_CACHE_ENABLED = False
+        _borg_pod._clear_forwarding_cache()
+        uncached = [_ns_per_call(statement.format("pod"), namespace, number) for statement in statements]
+        _borg_pod.FORWARDING_CACHE_ENABLED = True
+        cached = [_ns_per_call(statement.format("pod"), namespace, number) for statement in statements]
+    finally:
+        _borg_pod.FORWARDING_CACHE_ENABLED = enabled
+    for statement, before, after in zip(statements, uncached, cached):
+        results[statement.format("pod")] = (
+            _ns_per_call(statement.format("plain"), namespace, number), before, after
+        )
+    return results
+
+
+def generated_queen_benchmark(number=100000):
+    """
+    Compare a queen forwarding through __getattr__ with a generated queen class (@assimilate(generate_queen=True)).
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (plain ns, forwarding pod ns, generated pod ns)} per call.
+    """
+    namespace = {
+        "plain": _PlainBaseline(), "pod": _BenchDrone(), "generated": _GeneratedBenchDrone(),
+        "plain_class": _PlainBaseline, "pod_class": _BenchDrone, "generated_class": _GeneratedBenchDrone,
+    }
+    statements = ("{}.method", "{}.method()", "{}.static_method", "{}.value", "isinstance({0}, {0}_class)")
+    return {
+        statement.format("pod"): tuple(
+            _ns_per_call(statement.format(name), namespace, number) for name in ("plain", "pod", "generated")
+        ) for statement in statements
+    }
+
+
+def self_access_benchmark(number=100000):
+    """
+    Compare self.queen injected (wrapped), @resist, and undecorated method calls, on both the drone and the queen.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (ns,)} per call.
+    """
+    pod = _SelfAccessDrone()
+    namespace = {"pod": pod, "drone": pod.drone, "parent": _BenchParent(), "plain": _PlainBaseline()}
+    statements = (
+        "plain.method()", "parent.parent_method()",
+        "drone.wrapped_method()", "drone.parent_method()", "drone.resisted_method()",
+        "pod.wrapped_method()", "pod.parent_method()", "pod.resisted_method()",
+    )
+    return {statement: (_ns_per_call(statement, namespace, number),) for statement in statements}
+
+
+def operator_benchmark(number=100000):
+    """
+    Compare implemented, missing, and missing in-place operators on forwarding and generated pods.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (plain ns, forwarding pod ns, generated pod ns)} per call.
+    """
+    namespace = {
+        "plain": _PlainNumber(), "pod": _NumberDrone(), "generated": _GeneratedNumberDrone(),
+        "other": _ReflectedOperand(),
+    }
+    statements = ("{} + 1", "{} * other", "{} - other", "x = {}; x += 1")
+    return {
+        statement.format("pod"): tuple(
+            _ns_per_call(statement.format(name), namespace, number) for name in ("plain", "pod", "generated")
+        ) for statement in statements
+    }
+
+
+def lifecycle_benchmark(number=100000):
+    """
+    Time creating objects and converting them between two classes. A plain object's nearest equivalent of a conversion
+        is assigning its __class__ (which runs no __init__).
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (plain ns, forwarding pod ns, generated pod ns)} per call.
+    """
+    namespace = {
+        "plain": _PlainBaseline(), "pod": _BenchDrone(), "generated": _GeneratedBenchDrone(),
+        "plain_class": _PlainBaseline, "pod_class": _BenchDrone, "generated_class": _GeneratedBenchDrone,
+        "A": _SelfAccessDrone,
+    }
+    results = {"Cls()": tuple(
+        _ns_per_call("{}_class()".format(name), namespace, number) for name in ("plain", "pod", "generated")
+    )}
+    results["A(pod); B(pod)"] = (
+        _ns_per_call("plain.__class__ = _PlainOther; plain.__class__ = plain_class", dict(
+            namespace, _PlainOther=_PlainOther
+        ), number),
+        _ns_per_call("A(pod); pod_class(pod)", namespace, number),
+        _ns_per_call("A(generated); generated_class(generated)", namespace, number),
+    )
+    return results
+
+
+def identity_benchmark(number=100000):
+    """
+    Time hashing, comparing and set membership, which pods leave to the drone's class (here object's defaults).
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (plain ns, forwarding pod ns, generated pod ns)} per call.
+    """
+    namespace = {"other": _PlainBaseline()}
+    for name, factory in (("plain", _PlainBaseline), ("pod", _BenchDrone), ("generated", _GeneratedBenchDrone)):
+        objects = [factory() for _ in range(100)]
+        namespace[name], namespace[name + "_set"] = objects[0], set(objects)
+    statements = ("hash({})", "{0} == {0}", "{} == other", "{} != other", "{0} in {0}_set")
+    return {
+        statement.format("pod"): tuple(
+            _ns_per_call(statement.format(name), namespace, number) for name in ("plain", "pod", "generated")
+        ) for statement in statements
+    }
+
+
+def drone_reuse_benchmark(number=20000):
+    """
+    Time a pod oscillating between two classes with fresh drones, reused drones, and reused drones without re-init.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (fresh ns, reinit ns, no reinit ns)} per round trip.
+    """
+    pods = [_BenchDrone(), _BenchDrone(), _BenchDrone()]
+    enable_drone_cache(pods[1])
+    enable_drone_cache(pods[2], reinit=False)
+    namespace = {"A": _SelfAccessDrone, "B": _BenchDrone}
+    return {"A(pod); B(pod)": tuple(_ns_per_call("A(pod); B(pod)", dict(namespace, pod=pod), number) for pod in pods)}
+
+
+def queen_discovery_benchmark(number=100000, argument_counts=(0, 4, 16, 64)):
+    """
+    Time converting a pod found among a growing number of other constructor arguments, first and last.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+        :param tuple argument_counts: The numbers of other arguments to time.
+    :rtype: dict
+    :return: {statement: (ns per call for each argument count,)}.
+    """
+    namespace = {"Cls": _ArgumentDrone, "pod": _ArgumentDrone()}
+    namespace.update(("args_{}".format(count), tuple(range(count))) for count in argument_counts)
+    statements = ("Cls(pod, *args_{})", "Cls(*args_{}, pod)", "Cls(*args_{}, queen=pod)")
+    return {
+        statement.format("n"): tuple(
+            _ns_per_call(statement.format(count), namespace, number) for count in argument_counts
+        ) for statement in statements
+    }
+
+
+def bulk_conversion_benchmark(number=1000, pods=100):
+    """
+    Compare converting lists of pods back and forth one call at a time with assimilate_many.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+        :param int pods: The number of pods per list.
+    :rtype: dict
+    :return: {description: (loop ns, assimilate_many ns)} per pod converted.
+    """
+    results = {}
+    for description, new_class in (("forwarding", _BenchDrone), ("generated", _GeneratedBenchDrone)):
+        namespace = {
+            "pods": [new_class() for _ in range(pods)], "A": _SelfAccessDrone, "B": new_class,
+            "assimilate_many": assimilate_many,
+        }
+        results["A <-> {}".format(description)] = tuple(_ns_per_call(
+            statement, namespace, number
+        ) / (2 * pods) for statement in (
+            "[A(pod) for pod in pods]; [B(pod) for pod in pods]",
+            "list(assimilate_many(pods, A)); list(assimilate_many(pods, B))",
+        ))
+    return results
+
+
+def spawn_benchmark(number=100, pods=1000):
+    """
+    Compare making new pods one call at a time with spawn_many.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+        :param int pods: The number of pods per execution.
+    :rtype: dict
+    :return: {description: (loop ns, spawn_many ns)} per pod made.
+    """
+    results = {}
+    for description, new_class in (
+            ("forwarding", _BenchDrone), ("generated", _GeneratedBenchDrone), ("compact", _SlotPoint),
+    ):
+        namespace = {"pods": range(pods), "B": new_class, "spawn_many": spawn_many}
+        results[description] = tuple(_ns_per_call(statement, namespace, number) / pods for statement in (
+            "[B() for _ in pods]", "spawn_many(B, len(pods))",
+        ))
+    return results
+
+
+def class_index_benchmark(number=100, pods=10000):
+    """
+    Compare finding and counting the pods of a class by isinstance over every pod with the class index, and time
+        conversions with the index enabled.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+        :param int pods: The number of pods, half of which match.
+    :rtype: dict
+    :return: {statement: (ns per call,)}.
+    """
+    enable_class_index()
+    try:
+        all_pods = [_BenchDrone() for _ in range(pods // 2)] + [_SelfAccessDrone() for _ in range(pods // 2)]
+        namespace = {
+            "all_pods": all_pods, "pod": all_pods[0], "A": _SelfAccessDrone, "B": _BenchDrone,
+            "pods_of": pods_of, "pod_count": pod_count,
+        }
+        statements = (
+            "[pod for pod in all_pods if isinstance(pod, B)]", "pods_of(B)",
+            "sum(1 for pod in all_pods if isinstance(pod, B))", "pod_count(B)",
+        )
+        results = {statement: (_ns_per_call(statement, namespace, number),) for statement in statements}
+        results["A(pod); B(pod) (indexed)"] = (_ns_per_call("A(pod); B(pod)", namespace, number * 100),)
+    finally:
+        disable_class_index()
+    results["A(pod); B(pod)"] = (_ns_per_call("A(pod); B(pod)", namespace, number * 100),)
+    return results
+
+
+def metrics_benchmark(number=100000):
+    """
+    Time conversions, forwarded attribute lookups, and redirected operators with metrics disabled, enabled, and enabled
+        keeping only one event in 64.
+
+    :Parameters:
+        :param int number: The number of executions per timing run.
+    :rtype: dict
+    :return: {statement: (disabled ns, enabled ns, sampled ns)} per call.
+    """
+    namespace = {"A": _SelfAccessDrone, "B": _BenchDrone, "pod": _BenchDrone(), "number": _NumberDrone()}
+    statements = ("A(pod); B(pod)", "pod.method", "number + 1")
+    results = {statement: [] for statement in statements}
+    try:
+        for sample_every in (None, 1, 64):
+            if sample_every is not None:
+                enable_metrics(sample_every=sample_every)
+            for statement in statements:
+                results[statement].append(_ns_per_call(statement, namespace, number))
+    finally:
+        disable_metrics()
+    return {statement: tuple(timings) for statement, timings in results.items()}
+
+
+def _far_members(pods):
+    """The _FarPoints of a set or PodSet of pods, each the way it would be done."""
+    if isinstance(pods, PodSet):
+        return pods.of_class(_FarPoint)
+    return {pod for pod in pods if isinstance(pod, _FarPoint)}
+
+
+def containers_benchmark(pods=100000):
+    """
+    Time building, searching and combining sets and dicts of pods, as set and dict (which call BorgPod.__hash__ and
+        __eq__) and as PodSet and PodDict (which key pods by id). Half of the pods are _FarPoints.
+
+    :Parameters:
+        :param int pods: The number of pods per container.
+    :rtype: dict
+    :return: {statement: (set or dict ms, PodSet or PodDict ms)} per run.
+    """
+    points = [_SlotPoint() for _ in range(pods)]
+    list(assimilate_many(points[::2], _FarPoint))
+    halves = points[:pods // 2], points[pods // 4:]
+    results = {}
+    for container, mapping in ((set, dict.fromkeys), (PodSet, PodDict.fromkeys)):
+        first, second = container(halves[0]), container(halves[1])
+        table = mapping(points, 0)
+        for statement, run in (
+                ("build", lambda: container(points)),
+                ("contains", lambda: sum(map(first.__contains__, points))),
+                ("union", lambda: first | second),
+                ("intersection", lambda: first & second),
+                ("difference", lambda: first - second),
+                ("filter by class", lambda: _far_members(first)),
+                ("dict lookup", lambda: sum(map(table.__getitem__, points))),
+        ):
+            results.setdefault(statement, []).append(_ms_per_run(run))
+    return {statement: tuple(timings) for statement, timings in results.items()}
+
+
+def _bytes_per_object(factory, number):
+    """Traced bytes per object of number objects made by factory, not counting the list holding them."""
+    tracemalloc.start()
+    try:
+        objects = [None] * number
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(number):
+            objects[index] = factory()
+        return (tracemalloc.get_traced_memory()[0] - before) / number
+    finally:
+        tracemalloc.stop()
+
+
+def _bytes_per_pod_in_array(number):
+    """Traced bytes per pod of a PodArray of number _SlotPoint pods, with typed (double) columns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        pod_array = PodArray(_SlotPoint, number, typecodes={"x": "d", "y": "d"})
+        return (tracemalloc.get_traced_memory()[0] - before) / len(pod_array)
+    finally:
+        tracemalloc.stop()
+
+
+def memory_benchmark(number=1000000):
+    """
+    Measure the memory held per pod by two attribute dict mode and compact (__slots__) mode pods, and by the same
+        compact pods stored in a PodArray, with tracemalloc.
+
+    :Parameters:
+        :param int number: The number of objects to create per measurement.
+    :rtype: dict
+    :return: {description: (plain bytes, dict pod bytes, compact pod bytes, PodArray bytes)} per object.
+    """
+    return {"2 attribute pod": tuple(
+        _bytes_per_object(factory, number) for factory in (_PlainPoint, _DictPoint, _SlotPoint)
+    ) + (_bytes_per_pod_in_array(number),)}
+
+
+def _is_far(x, y, work):
+    """A stand-in for an expensive decision about a point: work rounds of arithmetic, then a distance test."""
+    distance = math.hypot(x, y)
+    for _ in range(work):
+        distance = math.sqrt(distance * distance)
+    return distance > 0.5
+
+
+def _far_pods(pods, work):
+    """A process pool worker: convert the far pods among pods, which were pickled here and are pickled back."""
+    for pod in pods:
+        if _is_far(pod.x, pod.y, work):
+            _FarPoint(pod)
+    return pods
+
+
+def _far_indices(handle, start, stop, work):
+    """A process pool worker: which of the pods in [start, stop) of a SharedPodStore are far, as transitions."""
+    with SharedPodStore.attach(handle) as columns:
+        xs, ys = columns["x"], columns["y"]
+        return [(index, _FarPoint) for index in range(start, stop) if _is_far(xs[index], ys[index], work)]
+
+
+def _random_points(pods):
+    """pods _SlotPoint pods at random (but repeatable) coordinates in the unit square."""
+    rng = random.Random(pods)
+    points = [_SlotPoint() for _ in range(pods)]
+    for point in points:
+        point.x, point.y = rng.random(), rng.random()
+    return points
+
+
+def _ms_per_pass(run, pods, repeat=3):
+    """The best of repeat timings, in ms, of run(points) on fresh _random_points(pods)."""
+    timings = []
+    for _ in range(repeat):
+        points = _random_points(pods)
+        start = time.perf_counter()
+        run(points)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def process_pool_benchmark(pods=100000, work=20, worker_counts=None):
+    """
+    Compare deciding which pods to convert (an expensive test of their coordinates) and converting them in one process
+        with doing the deciding in a ProcessPoolExecutor, either by sending the workers pickled pods (which they convert
+        and send back as new objects, losing the pods' identity) or by sharing the coordinates through a
+        SharedPodStore (the workers send back only (index, class) pairs, which are converted here).
+
+    :Parameters:
+        :param int pods: The number of pods per pass.
+        :param int work: The rounds of arithmetic per decision, i.e. how CPU bound the deciding is.
+        :param worker_counts: The pool sizes to time, by default 1, 2, 4 and os.cpu_count().
+    :rtype: dict
+    :return: {pool size: (in process ms, pickled pods ms, shared memory ms)} per pass over every pod.
+    """
+    def in_process(points):
+        list(assimilate_many([point for point in points if _is_far(point.x, point.y, work)], _FarPoint))
+
+    def pickled(points):
+        chunk = -(-len(points) // workers)
+        futures = [pool.submit(_far_pods, points[start:start + chunk], work) for start in range(0, len(points), chunk)]
+        points[:] = [point for future in futures for point in future.result()]
+
+    def shared(points):
+        chunk = -(-len(points) // workers)
+        with SharedPodStore(points, {"x": "d", "y": "d"}) as store:
+            futures = [pool.submit(_far_indices, store.handle(), start, min(start + chunk, len(points)), work)
+                       for start in range(0, len(points), chunk)]
+            store.apply(transition for future in futures for transition in future.result())
+
+    baseline = _ms_per_pass(in_process, pods)
+    results = {}
+    for workers in worker_counts or sorted({1, 2, 4, os.cpu_count() or 1}):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(abs, range(workers)))  # Start the workers before timing.
+            results["{} worker{}".format(workers, "s" * (workers > 1))] = (
+                baseline, _ms_per_pass(pickled, pods), _ms_per_pass(shared, pods)
+            )
+    return results
+
+
+def _decorated_chains(classes, lazy, depth=4, methods=10):
+    """Decorate classes generated classes, in chains of depth subclasses of methods methods each; the chains' ends."""
+    ends = []
+    for first in range(0, classes, depth):
+        parent = object
+        for index in range(first, min(first + depth, classes)):
+            namespace = {"method_{}".format(method): lambda self: self for method in range(methods)}
+            parent = assimilate(lazy=lazy)(type("_Generated{}".format(index), (parent,), namespace))
+        ends.append(parent)
+    return ends
+
+
+def _ms_per_run(run, repeat=3):
+    """The best of repeat timings, in ms, of run()."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def lazy_decoration_benchmark(classes=100):
+    """
+    Time decorating a module's worth of @assimilate classes (chains of subclasses with a few methods each) lazily and
+        eagerly, alone - as importing a module which defines them does - and followed by constructing a pod of each.
+
+    :Parameters:
+        :param int classes: The number of classes per timing run.
+    :rtype: dict
+    :return: {statement: (lazy ms, eager ms)} per timing run.
+    """
+    def construct(lazy):
+        for end in _decorated_chains(classes, lazy):
+            end()
+
+    return {
+        "decorate": tuple(_ms_per_run(lambda: _decorated_chains(classes, lazy)) for lazy in (True, False)),
+        "decorate and construct": tuple(_ms_per_run(lambda: construct(lazy)) for lazy in (True, False)),
+    }
+
+
+def import_benchmark(number=5):
+    """
+    Time starting a fresh interpreter, with and without importing borg_pod.
+
+    :Parameters:
+        :param int number: The number of interpreters to start per column, of which the fastest counts.
+    :rtype: dict
+    :return: {statement: (bare ms, import borg_pod ms)} per interpreter.
+    """
+    environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return {"python -c": tuple(
+        _ms_per_run(lambda: subprocess.run([sys.executable, "-c", code], env=environment, check=True), repeat=number)
+        for code in ("pass", "import borg_pod")
+    )}
+
+
+"""
+{name: (title, column names, unit, benchmark, share of main's number per timing run)} - every benchmark main runs, in
+    order. Each benchmark(number) returns {statement: (value per column, ...)}.
+"""
+BENCHMARKS = {
+    "lifecycle": (
+        "CREATION AND CONVERSION", ("plain", "forwarded", "generated"), "ns per call", lifecycle_benchmark, 1
+    ),
+    "forwarding": ("FORWARDED ATTRIBUTE READS", ("plain", "before", "after"), "ns per call", forwarding_benchmark, 1),
+    "generated_queen": (
+        "GENERATED QUEEN CLASSES", ("plain", "forwarded", "generated"), "ns per call", generated_queen_benchmark, 1
+    ),
+    "self_access": ("SELF ACCESS METHOD CALLS", ("ns",), "ns per call", self_access_benchmark, 1),
+    "operator": ("OPERATORS", ("plain", "forwarded", "generated"), "ns per call", operator_benchmark, 1),
+    "identity": (
+        "HASHING AND EQUALITY", ("plain", "forwarded", "generated"), "ns per call", identity_benchmark, 1
+    ),
+    "drone_reuse": ("DRONE REUSE", ("fresh", "reinit", "no reinit"), "ns per call", drone_reuse_benchmark, 0.2),
+    "queen_discovery": (
+        "QUEEN DISCOVERY", ("n=0", "n=4", "n=16", "n=64"), "ns per call", queen_discovery_benchmark, 1
+    ),
+    "bulk_conversion": ("BULK CONVERSION", ("loop", "bulk"), "ns per call", bulk_conversion_benchmark, 0.01),
+    "spawn": ("SPAWNING NEW PODS", ("loop", "spawn_many"), "ns per pod", spawn_benchmark, 0.001),
+    "class_index": ("CLASS INDEX", ("ns",), "ns per call", class_index_benchmark, 0.001),
+    "metrics": ("METRICS", ("disabled", "enabled", "sampled"), "ns per call", metrics_benchmark, 1),
+    "process_pool": (
+        "PROCESS POOL", ("in process", "pickled", "shared"), "ms per pass", process_pool_benchmark, 1
+    ),
+    "containers": ("POD CONTAINERS", ("builtin", "pod"), "ms per run", containers_benchmark, 1),
+    "lazy_decoration": ("LAZY DECORATION", ("lazy", "eager"), "ms per run", lazy_decoration_benchmark, 0.001),
+    "import": ("IMPORT", ("bare", "borg_pod"), "ms per interpreter", import_benchmark, 0.0001),
+    "memory": (
+        "MEMORY", ("plain", "dict pod", "compact pod", "pod array"), "bytes per object", memory_benchmark, 10
+    ),
+}
+
+
+def run_benchmarks(number=100000, names=None):
+    """
+    Run benchmarks, for a report which can be saved as JSON and compared with compare_reports.
+
+    :Parameters:
+        :param int number: The number of executions per timing run, scaled per benchmark (see BENCHMARKS).
+        :param names: The names (keys of BENCHMARKS) of the benchmarks to run, or None for all of them.
+    :rtype: dict
+    :return: {"python": version, "implementation": name, "platform": platform, "number": number, "benchmarks": {name:
+        {"title": title, "unit": unit, "columns": [column, ...], "results": {statement: [value, ...]}}}}.
+    """
+    unknown = set(names or ()).difference(BENCHMARKS)
+    if unknown:
+        raise ValueError("Unknown benchmarks: {}.".format(", ".join(sorted(unknown))))
+    benchmarks = {}
+    for name, (title, columns, unit, benchmark, share) in BENCHMARKS.items():
+        if names is None or name in names:
+            benchmarks[name] = {
+                "title": title, "unit": unit, "columns": list(columns),
+                "results": {
+                    statement: list(values) for statement, values in benchmark(max(1, int(number * share))).items()
+                },
+            }
+    return {
+        "python": platform.python_version(), "implementation": platform.python_implementation(),
+        "platform": platform.platform(), "number": number, "benchmarks": benchmarks,
+    }
+
+
+def compare_reports(baseline, report, threshold=1.25):
+    """
+    Find the values in report which grew by more than threshold times their value in baseline. Benchmarks, statements
+        and columns missing from either report are skipped.
+
+    :Parameters:
+        :param dict baseline: An earlier run_benchmarks report (e.g. loaded from its JSON).
+        :param dict report: The run_benchmarks report to check.
+        :param float threshold: How many times its baseline value a value may grow to before it counts.
+    :rtype: list
+    :return: [(benchmark name, statement, column, baseline value, value), ...] for every regression.
+    """
+    regressions = []
+    for name, benchmark in report["benchmarks"].items():
+        old_benchmark = baseline["benchmarks"].get(name)
+        if old_benchmark is None:
+            continue
+        for statement, values in benchmark["results"].items():
+            old_values = dict(zip(old_benchmark["columns"], old_benchmark["results"].get(statement, ())))
+            for column, value in zip(benchmark["columns"], values):
+                old_value = old_values.get(column)
+                if old_value and value > old_value * threshold:
+                    regressions.append((name, statement, column, old_value, value))
+    return regressions
+
+
+def _print_table(title, columns, results, unit="ns per call"):
+    """Print {statement: (value, ...)} under the given column names."""
+    width = max([32] + [len(statement) + 2 for statement in results])
+    print("\n____\n{} ({})".format(title, unit))
+    print(("{:<{width}}" + "{:>12}" * len(columns)).format("statement", *columns, width=width))
+    for statement, timings in results.items():
+        print(("{:<{width}}" + "{:>12.1f}" * len(timings)).format(statement, *timings, width=width))
+
+
+def main(argv=None):
+    """
+    Run the benchmarks and print their results as tables, optionally saving them as JSON and comparing them with an
+        earlier run's.
+
+    :param argv: Command line arguments (see --help), or None for sys.argv[1:].
+    :rtype: int
+    :return: The exit status: 1 if --compare found a regression, else 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m borg_pod.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000, help="executions per timing run (default 100000)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME", help="benchmarks to run")
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH as JSON (- for stdout only)")
+    parser.add_argument("--compare", metavar="PATH", help="compare with the JSON results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown counted as a regression (1.25)")
+    args = parser.parse_args(argv)
+    report = run_benchmarks(args.number, args.only)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for benchmark in report["benchmarks"].values():
+            _print_table(benchmark["title"], benchmark["columns"], benchmark["results"], unit=benchmark["unit"])
+        if args.json:
+            with open(args.json, "w") as results_file:
+                json.dump(report, results_file, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare_reports(json.load(baseline_file), report, args.threshold)
+        print("\n____\nREGRESSIONS (over {}x)".format(args.threshold), file=sys.stderr)
+        for name, statement, column, old_value, value in regressions:
+            print("{}: {} [{}] {:.1f} -> {:.1f}".format(name, statement, column, old_value, value), file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
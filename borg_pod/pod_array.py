@@ -0,0 +1,294 @@
+"""Columnar storage for many pods of compact classes, materialized one at a time on demand. See PodArray."""
+import operator
+import weakref
+from array import array
+from itertools import compress
+
+from .borg_pod import (
+    CompactBorgPod, assimilate_many, _PodState, _POD_LAYOUT, _SET_HOOKS, _bulk_converter, _rebind, _run_set_hooks,
+)
+
+
+_CLASS_CODE_TYPECODE = "H"  # Up to 65536 classes per PodArray, at 2 bytes per pod.
+
+
+class _ColumnRow(_PodState):
+    """
+    The shared state of a PodArray view, which is a row of the array's columns rather than a slot per attribute. Each
+        PodArray generates its own subclass with a _Column descriptor per column, which it adds to as it grows columns.
+    """
+    __slots__ = ("_pod_array", "_pod_index")
+
+    def __init__(self, pod_array, pod_index):
+        self._pod_array = pod_array
+        self._pod_index = pod_index
+
+    def _widened(self, layout):
+        """Rows widen in place - the array grows a column for each new name, which every one of its rows then has."""
+        self._pod_array._add_columns(layout)
+        return self
+
+
+class _Column(object):
+    """A data descriptor on a row class, which reads and writes one column of the row's PodArray."""
+    __slots__ = ("column", "default")
+
+    def __init__(self, column, default):
+        self.column = column
+        self.default = default
+
+    def __get__(self, row, row_class=None):
+        if row is None:
+            return self
+        return self.column[row._pod_index]
+
+    def __set__(self, row, value):
+        self.column[row._pod_index] = value
+
+    def __delete__(self, row):
+        self.column[row._pod_index] = self.default
+
+
+class _PodArrayQueen(CompactBorgPod):
+    """The queen of a PodArray view, which keeps its array's class code column up to date as it is converted."""
+    __slots__ = ()
+    _detached_queen_class = CompactBorgPod  # Copies (and pickles) of a view aren't in the array.
+
+    def _on_convert(self, drone_class):
+        row = self._pod_state
+        row._pod_array._codes[row._pod_index] = row._pod_array._class_code(drone_class)
+
+
+class PodArray(object):
+    """
+    The shared state of length pods of compact (__slots__) @assimilate classes, stored as columns - an array.array per
+        typed attribute, a list per untyped one, and a class code column in place of each queen's _active_class - rather
+        than as a queen, drone and state object per pod. pod_array[i] materializes pod i as a view: a CompactBorgPod
+        whose state is row i of the columns, which can be used and converted like any other pod, and is the same object
+        for as long as anything refers to it. Reading, writing and converting many pods at once (get, set, fill, and
+        convert, selected by a mask with a truth value per pod) works on the columns without materializing anything.
+
+    Unlike a slot, a column always has a value: 0 for typed columns and None otherwise until set, which deleting an
+        attribute resets it to. A class the pods are converted to adds columns for any attribute names it brings. Typed
+        columns support the buffer protocol, so numpy.frombuffer(pod_array.column(name), ...) is a view, not a copy.
+        Measured with tracemalloc over 1M two-attribute pods with typed double columns (python -m borg_pod.bench,
+        CPython 3.11), a pod takes 18 bytes in a PodArray to the 272 of a compact pod of its own.
+    """
+    def __init__(self, drone_class, length, typecodes=None):
+        """
+        :Parameters:
+            :param Class drone_class: The compact @assimilate class every pod starts as (without running its __init__).
+            :param int length: The number of pods.
+            :param dict typecodes: {attribute name: array typecode} for the columns to store as array.array rather than
+                as lists, e.g. {"x": "d", "y": "d"}.
+        """
+        self._length = operator.index(length)
+        self._typecodes = dict(typecodes or {})
+        self._columns = {}
+        self._classes = []
+        self._class_codes = {}
+        self._row_class = type(_ColumnRow.__name__, (_ColumnRow,), {
+            "__module__": __name__, "__slots__": (), _POD_LAYOUT: frozenset()
+        })
+        self._views = weakref.WeakValueDictionary()
+        self._codes = array(_CLASS_CODE_TYPECODE, [self._class_code(drone_class)]) * self._length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        """Materialize pod index (or get its view, if it is already materialized)."""
+        index = range(self._length)[operator.index(index)]  # Negative indices, and IndexError past either end.
+        view = self._views.get(index)
+        if view is None:
+            view = self._views[index] = _rebind(
+                _PodArrayQueen(self._row_class(self, index)), self._classes[self._codes[index]]
+            )
+        return view
+
+    def __iter__(self):
+        return self.pods()
+
+    def pods(self, mask=None):
+        """
+        Materialize each pod selected by mask (or every pod) in turn.
+
+        :param mask: A truth value per pod, or None for every pod.
+        :rtype: generator
+        :return: The views (queens) of the selected pods, in order.
+        """
+        for index in self._selected(mask):
+            yield self[index]
+
+    def class_of(self, index):
+        """The class pod index currently is, read from the class code column."""
+        return self._classes[self._codes[index]]
+
+    def mask(self, drone_class):
+        """
+        Which pods currently are drone_class or a subclass of it, without materializing them.
+
+        :param Class drone_class: The class to look for.
+        :rtype: list
+        :return: A bool per pod.
+        """
+        matches = [issubclass(klass, drone_class) for klass in self._classes]
+        return [matches[code] for code in self._codes]
+
+    def column(self, name):
+        """
+        The column holding attribute name for every pod - the column itself, not a copy, so writes to it are writes to
+            the pods. They are not seen by dirty tracking, snapshots or @borg_cached methods (as writes through set and
+            fill are), so use those while any of them are in use.
+
+        :param str name: The attribute name.
+        :rtype: array.array or list
+        :return: The column, with a value per pod.
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError("{} has no column '{}'.".format(type(self).__name__, name)) from None
+
+    def get(self, name, mask=None):
+        """
+        Read attribute name across the pods selected by mask (or every pod).
+
+        :Parameters:
+            :param str name: The attribute name.
+            :param mask: A truth value per pod, or None for every pod.
+        :rtype: array.array or list
+        :return: A copy of the selected values, in order.
+        """
+        column = self.column(name)
+        if mask is None:
+            return column[:]
+        values = compress(column, self._checked(mask))
+        return array(column.typecode, values) if isinstance(column, array) else list(values)
+
+    def set(self, name, values, mask=None):
+        """
+        Write attribute name across the pods selected by mask (or every pod), one value per selected pod. Set hooks
+            (dirty tracking, snapshots and @borg_cached) are run for the selected pods which are materialized - the
+            others have nothing tracked or cached to update.
+
+        :Parameters:
+            :param str name: The attribute name.
+            :param values: A sequence with a value for each selected pod, in order.
+            :param mask: A truth value per pod, or None for every pod.
+        :rtype: None
+        :return: None
+        """
+        column = self.column(name)
+        indices = range(self._length) if mask is None else list(self._selected(mask))
+        if len(values) != len(indices):
+            raise ValueError("Expected {} values for '{}', not {}.".format(len(indices), name, len(values)))
+        self._run_set_hooks(name, mask)
+        if mask is None and isinstance(column, array):
+            column[:] = values if isinstance(values, array) and values.typecode == column.typecode else array(
+                column.typecode, values
+            )
+        elif mask is None:
+            column[:] = values
+        else:
+            for index, value in zip(indices, values):
+                column[index] = value
+
+    def fill(self, name, value, mask=None):
+        """Write the same value to attribute name of each pod selected by mask (or every pod), as set does."""
+        column = self.column(name)
+        if mask is not None:
+            self._checked(mask)
+        self._run_set_hooks(name, mask)
+        if mask is None:
+            column[:] = (array(column.typecode, [value]) if isinstance(column, array) else [value]) * self._length
+        else:
+            for index in self._selected(mask):
+                column[index] = value
+
+    def convert(self, new_class, mask=None, init=False):
+        """
+        Convert each pod selected by mask (or every pod) to new_class. By default only the class code column changes
+            (and the drones of any materialized views are swapped), so new_class.__init__ isn't run - set the columns
+            it would have set with set or fill. With init=True, each selected pod is materialized and converted as
+            new_class(pod) would be.
+
+        :Parameters:
+            :param Class new_class: The compact @assimilate class to convert the selected pods to.
+            :param mask: A truth value per pod, or None for every pod.
+            :param bool init: Whether to run new_class.__init__ for each selected pod.
+        :rtype: None
+        :return: None
+        """
+        code = self._class_code(new_class)
+        if init:
+            for _ in assimilate_many(self.pods(mask), new_class):
+                pass
+            return
+        if mask is None:
+            self._codes[:] = array(_CLASS_CODE_TYPECODE, [code]) * self._length
+        else:
+            codes = self._codes
+            for index in self._selected(mask):
+                codes[index] = code
+        views = [view for index, view in list(self._views.items()) if mask is None or mask[index]]
+        for _ in _bulk_converter(new_class)(views, (), {}, False):
+            pass
+
+    def _run_set_hooks(self, name, mask):
+        """Run the set hooks for name on the materialized views mask selects, before their values are written."""
+        if _SET_HOOKS:
+            for index, view in list(self._views.items()):
+                if mask is None or mask[index]:
+                    _run_set_hooks(view, name)
+
+    def _checked(self, mask):
+        """mask, once it has been checked to have a truth value per pod."""
+        if len(mask) != self._length:
+            raise ValueError("Expected a mask of {} values, not {}.".format(self._length, len(mask)))
+        return mask
+
+    def _selected(self, mask):
+        """The indices of the pods mask selects (every pod if mask is None)."""
+        if mask is None:
+            return iter(range(self._length))
+        return compress(range(self._length), self._checked(mask))
+
+    def _class_code(self, drone_class):
+        """The class code of drone_class, adding it (and columns for its attribute names) if it is new."""
+        try:
+            return self._class_codes[drone_class]
+        except KeyError:
+            pass
+        layout = vars(drone_class).get(_POD_LAYOUT)
+        if layout is None or _bulk_converter(drone_class) is None:
+            raise TypeError("{} is not a compact (__slots__) @assimilate decorated class.".format(drone_class.__name__))
+        self._add_columns(layout)
+        code = self._class_codes[drone_class] = len(self._classes)
+        self._classes.append(drone_class)
+        return code
+
+    def _add_columns(self, names):
+        """Add a column (and a descriptor to the row class) for each of names which doesn't have one yet."""
+        new_names = sorted(set(names).difference(self._columns))
+        for name in new_names:
+            typecode = self._typecodes.get(name)
+            if typecode is None:
+                default = None
+                column = [default] * self._length
+            else:
+                default = array(typecode, [0])[0]
+                column = array(typecode, [default]) * self._length
+            self._columns[name] = column
+            setattr(self._row_class, name, _Column(column, default))
+        if new_names:
+            setattr(self._row_class, _POD_LAYOUT, frozenset(self._columns))
+
+
+def main():
+    from ._demo import _pod_array_test
+    _pod_array_test()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""Sets and dicts of pods keyed by the pods' ids, without calling their __hash__ or __eq__. See PodSet and PodDict."""
+from collections import deque
+from collections.abc import ItemsView, MutableMapping, MutableSet, Set
+from itertools import chain, compress, repeat
+from operator import attrgetter
+
+from .borg_pod import BorgPod, _ACTIVE_CLASS
+
+
+_get_active_class = attrgetter(_ACTIVE_CLASS)
+
+
+class _DroneTypeMatches(dict):
+    """{drone type: whether it is drone_class or a subclass of it}, filled in as drone types are looked up."""
+    def __init__(self, drone_class):
+        super().__init__()
+        self.drone_class = drone_class
+
+    def __missing__(self, drone_type):
+        matches = self[drone_type] = issubclass(drone_type, self.drone_class)
+        return matches
+
+
+def _class_filter(pods, drone_class):
+    """A truth value per pod in pods (an iterable), for whether it is currently drone_class or a subclass of it."""
+    return map(_DroneTypeMatches(drone_class).__getitem__, map(type, map(_get_active_class, pods)))
+
+
+def _pod_index(pods, strict=True):
+    """
+    {id(pod): pod} for pods - the index of a PodSet or PodDict itself, or a new one for any other iterable of pods.
+
+    :Parameters:
+        :param pods: An iterable of borg pods.
+        :param bool strict: Whether to check that they are all borg pods. Where anything else is just never a match (it
+            can't share an id with a live member), there is no need to.
+    :raises TypeError: If strict and anything in pods isn't a borg pod.
+    """
+    if isinstance(pods, (PodSet, PodDict)):
+        return pods._pods
+    pods = list(pods)
+    if strict and not all(map(isinstance, pods, repeat(BorgPod))):
+        _not_a_pod_error(next(pod for pod in pods if not isinstance(pod, BorgPod)))
+    return dict(zip(map(id, pods), pods))
+
+
+def _not_a_pod_error(value):
+    raise TypeError("Expected a borg pod, not a {} object.".format(type(value).__name__))
+
+
+class PodSet(MutableSet):
+    """
+    A set of pods (queens), kept as {id(pod): pod}. A pod is equal only to itself and hashes by its id (see
+        BorgPod.__hash__ and __eq__), so this holds the same members a set of the same pods would, but adding, finding
+        and removing a pod hashes an int rather than calling Python level __hash__ and __eq__ methods. Since a member is
+        kept alive by the set, no other object can have its id while it is a member. Unions, intersections and
+        differences with other PodSets and PodDicts work on their ids alone, and of_class selects the pods which are
+        currently a given class without asking each pod for its __class__.
+
+    Members are kept in the order they were added. Anything that isn't a borg pod is never a member, and adding one
+        raises TypeError. An operator with some other set on the left (e.g. {1} - pod_set) gives a PodSet if its result
+        is all pods, or a plain set if not.
+    """
+    __slots__ = ("_pods",)
+
+    def __init__(self, pods=()):
+        """
+        :param pods: An iterable of borg pods (e.g. a list, set, PodSet or PodDict's pods).
+        """
+        self._pods = pods._pods.copy() if isinstance(pods, (PodSet, PodDict)) else _pod_index(pods)
+
+    @classmethod
+    def _from_index(cls, index):
+        pod_set = cls.__new__(cls)
+        pod_set._pods = index
+        return pod_set
+
+    @classmethod
+    def _from_iterable(cls, values):
+        """
+        What the Set mixins (__rand__, __ror__ and __rsub__, e.g. {1} - pod_set) build their results with: a PodSet if
+            values are all borg pods, or a plain set, since the other operand may hold anything.
+        """
+        values = list(values)
+        if all(map(isinstance, values, repeat(BorgPod))):
+            return cls._from_index(dict(zip(map(id, values), values)))
+        return set(values)
+
+    def __len__(self):
+        return len(self._pods)
+
+    def __iter__(self):
+        return iter(self._pods.values())
+
+    def __contains__(self, pod):
+        return id(pod) in self._pods
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self._pods.values()))
+
+    def __reduce__(self):
+        return type(self), (list(self._pods.values()),)
+
+    __hash__ = None
+
+    def __eq__(self, other):
+        if isinstance(other, Set):
+            return self._pods.keys() == _pod_index(other, strict=False).keys()
+        return NotImplemented
+
+    def __le__(self, other):
+        return self.issubset(other) if isinstance(other, Set) else NotImplemented
+
+    def __ge__(self, other):
+        return self.issuperset(other) if isinstance(other, Set) else NotImplemented
+
+    def add(self, pod):
+        if not isinstance(pod, BorgPod):
+            _not_a_pod_error(pod)
+        self._pods[id(pod)] = pod
+
+    def discard(self, pod):
+        self._pods.pop(id(pod), None)
+
+    def remove(self, pod):
+        try:
+            del self._pods[id(pod)]
+        except KeyError:
+            raise KeyError(pod) from None
+
+    def pop(self):
+        """Remove and return the most recently added pod."""
+        try:
+            return self._pods.popitem()[1]
+        except KeyError:
+            raise KeyError("pop from an empty {}".format(type(self).__name__)) from None
+
+    def clear(self):
+        self._pods.clear()
+
+    def copy(self):
+        return self._from_index(self._pods.copy())
+
+    __copy__ = copy
+
+    def update(self, *others):
+        """Add the pods of each of others (iterables of pods)."""
+        for other in others:
+            self._pods.update(_pod_index(other))
+
+    def difference_update(self, *others):
+        """Remove the pods of each of others (iterables of pods) - those which are members, that is."""
+        for other in others:
+            pods = self._pods
+            if isinstance(other, (PodSet, PodDict)) and len(other) > len(pods):
+                # Keep what other doesn't have, rather than looking up more ids than there are members.
+                other = other._pods
+                self._pods = {key: pod for key, pod in pods.items() if key not in other}
+                continue
+            other = other._pods if isinstance(other, (PodSet, PodDict)) else map(id, other)
+            deque(map(pods.pop, other, repeat(None)), maxlen=0)
+
+    def intersection_update(self, *others):
+        """Keep only the pods which are also in every one of others (iterables of pods)."""
+        self._pods = self.intersection(*others)._pods
+
+    def union(self, *others):
+        """
+        The pods of this set and of each of others.
+
+        :param others: Iterables of borg pods.
+        :rtype: PodSet
+        :return: A new set.
+        """
+        pod_set = self.copy()
+        pod_set.update(*others)
+        return pod_set
+
+    def difference(self, *others):
+        """
+        The pods of this set which aren't in any of others.
+
+        :param others: Iterables of borg pods (or of anything - only pods can match).
+        :rtype: PodSet
+        :return: A new set.
+        """
+        pod_set = self.copy()
+        pod_set.difference_update(*others)
+        return pod_set
+
+    def intersection(self, *others):
+        """
+        The pods of this set which are also in every one of others.
+
+        :param others: Iterables of borg pods.
+        :rtype: PodSet
+        :return: A new set.
+        """
+        pods = self._pods
+        for other in others:
+            other = _pod_index(other, strict=False)
+            # Check the ids of the smaller against the larger. Either has the same pod for an id they share.
+            smaller, larger = (pods, other) if len(pods) <= len(other) else (other, pods)
+            pods = dict(compress(smaller.items(), map(larger.__contains__, smaller)))
+        return self._from_index(pods if pods is not self._pods else pods.copy())
+
+    def symmetric_difference(self, other):
+        """The pods in exactly one of this set and other (an iterable of pods), as a new set."""
+        other = _pod_index(other)
+        pods = self._pods
+        ids = pods.keys() ^ other.keys()
+        return self._from_index({key: pods[key] if key in pods else other[key] for key in ids})
+
+    def issubset(self, other):
+        return self._pods.keys() <= _pod_index(other, strict=False).keys()
+
+    def issuperset(self, other):
+        return self._pods.keys() >= _pod_index(other, strict=False).keys()
+
+    def isdisjoint(self, other):
+        return self._pods.keys().isdisjoint(_pod_index(other, strict=False).keys())
+
+    def __or__(self, other):
+        return self.union(other) if isinstance(other, Set) else NotImplemented
+
+    def __and__(self, other):
+        return self.intersection(other) if isinstance(other, Set) else NotImplemented
+
+    def __sub__(self, other):
+        return self.difference(other) if isinstance(other, Set) else NotImplemented
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other) if isinstance(other, Set) else NotImplemented
+
+    def __rxor__(self, other):
+        # Set.__xor__ would join the two differences through __or__, which only takes pods.
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self._from_iterable(chain((value for value in other if value not in self), self.difference(other)))
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def of_class(self, drone_class):
+        """
+        The members which are currently drone_class or a subclass of it, found by checking each distinct drone type
+            once rather than asking each pod for its __class__.
+
+        :param Class drone_class: The class to select, e.g. _Circle for both _Circle and _Ellipse pods.
+        :rtype: PodSet
+        :return: A new set.
+        """
+        pods = self._pods
+        return self._from_index(dict(compress(pods.items(), _class_filter(pods.values(), drone_class))))
+
+
+class _PodItemsView(ItemsView):
+    """A PodDict's items, iterated from its two dicts at once rather than looking up each pod's value in turn."""
+    __slots__ = ()
+
+    def __iter__(self):
+        return zip(self._mapping._pods.values(), self._mapping._values.values())
+
+
+class PodDict(MutableMapping):
+    """
+    A dict keyed by pods (queens), kept as {id(pod): pod} and {id(pod): value}, for the same reasons as PodSet: a pod
+        is only equal to itself, so looking a pod up by its id finds what looking it up by its hash would, without
+        calling any Python level __hash__ or __eq__. Keys are kept in the order they were first set, and must be borg
+        pods (anything else raises TypeError).
+    """
+    __slots__ = ("_pods", "_values")
+
+    def __init__(self, items=(), **kwargs):
+        """
+        :param items: A PodDict or mapping with borg pod keys, or an iterable of (pod, value) pairs.
+        """
+        if kwargs:
+            raise TypeError("{} keys must be borg pods, not keyword arguments.".format(type(self).__name__))
+        self._pods = {}
+        self._values = {}
+        self.update(items)
+
+    @classmethod
+    def fromkeys(cls, pods, value=None):
+        """A PodDict mapping each of pods (an iterable of borg pods) to value."""
+        pod_dict = cls()
+        pod_dict._pods = pods._pods.copy() if isinstance(pods, (PodSet, PodDict)) else _pod_index(pods)
+        pod_dict._values = dict.fromkeys(pod_dict._pods, value)
+        return pod_dict
+
+    def __len__(self):
+        return len(self._pods)
+
+    def __iter__(self):
+        return iter(self._pods.values())
+
+    def __contains__(self, pod):
+        return id(pod) in self._pods
+
+    def __getitem__(self, pod):
+        try:
+            return self._values[id(pod)]
+        except KeyError:
+            raise KeyError(pod) from None
+
+    def __setitem__(self, pod, value):
+        key = id(pod)
+        if key not in self._pods:
+            if not isinstance(pod, BorgPod):
+                _not_a_pod_error(pod)
+            self._pods[key] = pod
+        self._values[key] = value
+
+    def __delitem__(self, pod):
+        key = id(pod)
+        try:
+            del self._values[key]
+        except KeyError:
+            raise KeyError(pod) from None
+        del self._pods[key]
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self.items()))
+
+    def __reduce__(self):
+        return type(self), (list(self.items()),)
+
+    def __eq__(self, other):
+        if isinstance(other, PodDict):
+            return self._values == other._values
+        return super().__eq__(other)
+
+    def get(self, pod, default=None):
+        return self._values.get(id(pod), default)
+
+    def pop(self, pod, *default):
+        key = id(pod)
+        if key in self._pods:
+            del self._pods[key]
+            return self._values.pop(key)
+        if default:
+            return default[0]
+        raise KeyError(pod)
+
+    def clear(self):
+        self._pods.clear()
+        self._values.clear()
+
+    def copy(self):
+        pod_dict = type(self)()
+        pod_dict._pods = self._pods.copy()
+        pod_dict._values = self._values.copy()
+        return pod_dict
+
+    __copy__ = copy
+
+    def update(self, items=(), **kwargs):
+        """Set the items of items (a PodDict, a mapping with borg pod keys, or an iterable of (pod, value) pairs)."""
+        if kwargs:
+            raise TypeError("{} keys must be borg pods, not keyword arguments.".format(type(self).__name__))
+        if isinstance(items, PodDict):
+            self._pods.update(items._pods)
+            self._values.update(items._values)
+            return
+        if hasattr(items, "keys"):
+            items = ((key, items[key]) for key in items.keys())
+        pods, values = [], []
+        for pod, value in items:
+            pods.append(pod)
+            values.append(value)
+        index = _pod_index(pods)
+        self._pods.update(index)
+        self._values.update(zip(map(id, pods), values))
+
+    def values(self):
+        return self._values.values()
+
+    def items(self):
+        return _PodItemsView(self)
+
+    def of_class(self, drone_class):
+        """
+        The items whose pods are currently drone_class or a subclass of it (see PodSet.of_class).
+
+        :param Class drone_class: The class to select.
+        :rtype: PodDict
+        :return: A new PodDict.
+        """
+        pods = self._pods
+        pod_dict = type(self)()
+        pod_dict._pods = dict(compress(pods.items(), _class_filter(pods.values(), drone_class)))
+        values = self._values
+        pod_dict._values = dict(zip(pod_dict._pods, map(values.__getitem__, pod_dict._pods)))
+        return pod_dict
+
+
+def main():
+    from ._demo import _pod_containers_test
+    _pod_containers_test()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Pod attributes in shared memory, for deciding pods' classes in other processes. See SharedPodStore."""
+import os
+from array import array
+from itertools import groupby
+from operator import itemgetter
+
+from .borg_pod import assimilate_many
+
+
+_ALIGNMENT = 8  # Each column starts on a multiple of this many bytes.
+
+
+class SharedPodStore(object):
+    """
+    A copy of some primitive (int, float, ...) attributes of a sequence of pods, as typed columns in one block of
+        multiprocessing.shared_memory. Rather than being sent the pods, worker processes (e.g. of a
+        concurrent.futures.ProcessPoolExecutor) are sent handle() - the block's name and layout, which pickles in the
+        same few bytes however many pods there are - and read the columns through SharedPodStore.attach. They send
+        back only what each pod should become, which apply() carries out in this process through the usual conversion
+        path, so the pods keep their identity. refresh() copies the attributes again once the pods have changed.
+
+    Use it as a context manager (or call close) so that the shared memory is freed.
+    """
+    def __init__(self, pods, typecodes):
+        """
+        :Parameters:
+            :param pods: The borg pods (queens) to store, in the order workers will index them.
+            :param dict typecodes: {attribute name: array typecode}, e.g. {"x": "d", "y": "d"}. A pod without one of the
+                attributes has 0 stored for it.
+        """
+        from multiprocessing import shared_memory  # Here, as importing it takes longer than importing all of borg_pod.
+        self.pods = list(pods)
+        self._memory = None
+        self.columns = {}
+        layout = []
+        size = 0
+        for name, typecode in sorted(typecodes.items()):
+            layout.append((name, typecode, size))
+            size += -(-array(typecode).itemsize * len(self.pods) // _ALIGNMENT) * _ALIGNMENT
+        self._memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._handle = (self._memory.name, len(self.pods), tuple(layout))
+        try:
+            self.columns = _map_columns(self._memory, self._handle)
+            self.refresh()
+        except BaseException:
+            self.close()  # Nothing else will free the block, as the store is never returned.
+            raise
+
+    def __len__(self):
+        return len(self.pods)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def handle(self):
+        """What a worker needs to attach to the columns (see attach): a small, picklable tuple."""
+        return self._handle
+
+    @staticmethod
+    def attach(handle):
+        """
+        Attach to a store's columns from a worker process.
+
+        :param tuple handle: The store's handle().
+        :rtype: _AttachedColumns
+        :return: A context manager giving {attribute name: memoryview column, indexed like the store's pods}.
+        """
+        return _AttachedColumns(handle)
+
+    def refresh(self, indices=None):
+        """
+        Copy the stored attributes of the pods at indices (or of every pod) into the columns again.
+
+        :param indices: The indices of the pods which changed, or None for every pod.
+        :rtype: None
+        :return: None
+        """
+        pods = self.pods
+        for name, column in self.columns.items():
+            if indices is None:
+                column[:] = array(column.format, [getattr(pod, name, 0) for pod in pods])
+            else:
+                for index in indices:
+                    column[index] = getattr(pods[index], name, 0)
+
+    def apply(self, transitions, *args, **kwargs):
+        """
+        Convert pods as workers decided, in the order given, through assimilate_many (one call per run of consecutive
+            transitions to the same class, so a pod given several transitions ends up as the last one's class).
+
+        :Parameters:
+            :param transitions: An iterable of (pod index, @assimilate decorated class to convert that pod to).
+            :param args: Positional arguments for each class's __init__.
+            :param kwargs: Keyword arguments for each class's __init__.
+        :rtype: int
+        :return: The number of conversions carried out - one per transition.
+        """
+        converted = 0
+        for new_class, run in groupby(transitions, key=itemgetter(1)):
+            pods = [self.pods[index] for index, _ in run]
+            for _ in assimilate_many(pods, new_class, *args, **kwargs):
+                pass
+            converted += len(pods)
+        return converted
+
+    def close(self):
+        """Free the shared memory (if it isn't already). Workers must be done with it."""
+        if self._memory is not None:
+            _release_columns(self.columns)
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+
+class _AttachedColumns(object):
+    """A worker's attachment to a SharedPodStore's columns, see SharedPodStore.attach."""
+    def __init__(self, handle):
+        self._handle = handle
+        self._memory = None
+        self._columns = None
+
+    def __enter__(self):
+        self._memory = _attach_untracked(self._handle[0])
+        try:
+            self._columns = _map_columns(self._memory, self._handle)
+        except BaseException:
+            self._memory.close()
+            raise
+        return self._columns
+
+    def __exit__(self, *exc_info):
+        _release_columns(self._columns)
+        self._memory.close()
+
+
+def _attach_untracked(name):
+    """
+    Attach to the shared memory block called name without registering it with this process's resource tracker: the
+        block is its creator's to unlink, but a tracker of a process forked before its creator's tracker started would
+        unlink it (and warn of a leak) when the process exits. Python 3.13 added track=False for this. Before that, a
+        POSIX block (the only kind which is tracked) is mapped as SharedMemory would map it, less the registration.
+    """
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name=name)
+    return _UntrackedBlock(name)
+
+
+class _UntrackedBlock(object):
+    """A POSIX shared memory block attached without the resource tracker (see _attach_untracked), as buf and close."""
+    def __init__(self, name):
+        import _posixshmem
+        import mmap
+        fd = _posixshmem.shm_open("/" + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)  # The mapping keeps the block open.
+        self.buf = memoryview(self._mmap)
+
+    def close(self):
+        self.buf.release()
+        self._mmap.close()
+
+
+def _map_columns(memory, handle):
+    """{attribute name: memoryview of its column} for the block memory laid out as described by handle."""
+    _, length, layout = handle
+    return {
+        name: memory.buf[offset:offset + array(typecode).itemsize * length].cast(typecode)
+        for name, typecode, offset in layout
+    }
+
+
+def _release_columns(columns):
+    """Release the column memoryviews, so that the block they are views of can be closed."""
+    for column in columns.values():
+        column.release()
+    columns.clear()
+
+
+def main():
+    from ._demo import _shared_store_test
+    _shared_store_test()
+
+
+if __name__ == "__main__":
+    main()